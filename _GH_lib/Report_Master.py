@@ -1,117 +1,148 @@
-# -*- coding: utf-8 -*-
-"""
-Created on Fri Feb 11 21:16:53 2022
-
-@author: grega
-"""
-import time
-
-import EquityAnalysis as EA
-from mwr_utils import my_str_to_date, EndOfWeek
-from yield_plot import yield_curve
-import my_weekly_articles as mwa
-from dp_post import DataPane_Post
-from figure_frames import HPR_df
-
-## Import selenium for web scraping
-from selenium import webdriver
-from init_browser import init_browser
-# from selenium.webdriver.common.by import By
-# from selenium.common.exceptions import NoSuchElementException, ElementNotInteractableException
-
-# Create datetime variables for monday and friday of this week
-monday = my_str_to_date(EndOfWeek(True)[0])
-friday = my_str_to_date(EndOfWeek(True)[1])
-
-## Collect the necessary price/yield info
-Tickers = [
-    '^GSPC', '^DJI', '^IXIC', 'VTI', 'VEU', 'VDE', '^VIX', 'GC=F',
-    'CL=F', 'ZC=F', 'EURUSD=X', 'GBPUSD=X', 'CNYUSD=X', 'BTC-USD'
-]
-AsstCls = ['EQUITY' for tick in Tickers]
-
-names   = {
-    '^GSPC': 'S&P 500 Index',
-    '^DJI': 'Dow Jones Industrial Average',
-    '^IXIC': 'NASDAQ Composite Index',
-    'VTI': 'Vanguard Total U.S. Stock Market Index Fund',
-    'VEU': 'Vanguard All-World ex-U.S. Large Blend ETF',
-    'VDE': 'Vanguard Energy Index Fund ETF',
-    '^VIX': 'S&P 500 Volatility Index',
-    'GC=F': 'Gold Front Month Futures',
-    'CL=F': 'Crude Oil WTI Front Month Futures',
-    'ZC=F': 'Corn Front Month Futures',
-    'EURUSD=X': 'EURO-USD',
-    'GBPUSD=X': 'GBP-USD',
-    'CNYUSD=X': 'CNY-USD',
-    'BTC-USD': 'Bitcoin-USD'
-}
-data = EA.Data(tickers = Tickers,
-                period='3y',
-                interval='1d')
-data.Collect(DataType='prices')
-all_prices = data.PriceData
-
-stats_df, decile_data = HPR_df(all_prices, '^GSPC', friday)
-# stats_df
-
-# Yield Curve
-yc_dat = yield_curve(friday)
-
-# Create the necessary webdriver object
-driver = init_browser()
-
-# Collect relevant article links using the `my_weekly_articles.py` script
-article_dfs_lst = []
-keys = []
-i = 1
-for asset_class, tick in zip(AsstCls + ['EQUITY'], Tickers + ['YIELD']):
-    
-    print(f"Collecting articles for {tick}\n\n")
-    
-    if tick not in keys:
-        
-        sa = mwa.summarize_articles(asset_class, tick, driver = driver)
-        sa.go()
-        
-        index_df = sa.index_df
-        index_df = index_df.loc[
-            :10,
-            ['LMcD_Neg_Terms',  'LMcD_Pos_Terms',  'LMcD_Tot_Terms',
-             'Date_Relevance',  'Title_Relevance', 'Relevancy_Score',
-             'Source', 'Date', 'Title', 'Link', 'Polarity', 'Subjectivity']
-        ]
-        
-        ## Create column for plotly/html formatted title-link combo
-        index_df.loc[:, 'Article'] = index_df.apply(
-            lambda x: f'<a href="{x.Link}">{x.Title}</a>',
-            axis=1
-        )
-        
-        ## Collect the asset summary
-        asset_summary = sa.asset_summary
-        
-        article_dfs_lst.append([tick, index_df, asset_summary])
-        
-        i += 1
-        
-    print(f"Collected articles for {tick} | {round(100 * i / (len(Tickers) + 1), 2)}\n\n")
-    keys.append(tick)
-
-driver.quit()
-
-desc = open('Authors Notes.txt').read()
-
-DataPane_Post(Tickers, names, all_prices, yc_dat, article_dfs_lst, desc, friday)
-
-# plotly_article_table('YIELD', article_dfs_lst)
-
-# # # ## Test the Equity_Plot function
-# e_fig = Equity_Plot(all_prices, 'BTC-USD', article_dfs_lst, names)
-
-# # # ## Test the Yield_Plot function
-# y_fig = Yield_Plot(yc_dat, article_dfs_lst)
-
-# from plotly.offline import download_plotlyjs, init_notebook_mode,  plot
-# plot(e_fig)
-# plot(y_fig)
+# -*- coding: utf-8 -*-
+"""
+Created on Fri Feb 11 21:16:53 2022
+
+@author: grega
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import EquityAnalysis as EA
+from mwr_utils import my_str_to_date, EndOfWeek
+from yield_plot import yield_curve, lod_dates
+import my_weekly_articles as mwa
+from dp_post import DataPane_Post
+from figure_frames import HPR_df
+from report_profiler import ReportProfiler
+
+## Import selenium for web scraping
+from selenium import webdriver
+from init_browser import init_browser
+from scrape_pool import DriverPool
+from browser_service import attach
+from article_registry import ArticleRegistry
+from dedup import SentenceDeduper
+from sentiment import sentiment_service
+# from selenium.webdriver.common.by import By
+# from selenium.common.exceptions import NoSuchElementException, ElementNotInteractableException
+
+# Create datetime variables for monday and friday of this week
+monday = my_str_to_date(EndOfWeek(True)[0])
+friday = my_str_to_date(EndOfWeek(True)[1])
+
+## Collect the necessary price/yield info
+Tickers = [
+    '^GSPC', '^DJI', '^IXIC', 'VTI', 'VEU', 'VDE', '^VIX', 'GC=F',
+    'CL=F', 'ZC=F', 'EURUSD=X', 'GBPUSD=X', 'CNYUSD=X', 'BTC-USD'
+]
+AsstCls = ['EQUITY' for tick in Tickers]
+
+# Asset class groupings used to split the report up if it grows past the page budget
+ReportCls = ['EQUITY'] * 7 + ['COMMODITY'] * 3 + ['FX'] * 3 + ['CRYPTO']
+
+names   = {
+    '^GSPC': 'S&P 500 Index',
+    '^DJI': 'Dow Jones Industrial Average',
+    '^IXIC': 'NASDAQ Composite Index',
+    'VTI': 'Vanguard Total U.S. Stock Market Index Fund',
+    'VEU': 'Vanguard All-World ex-U.S. Large Blend ETF',
+    'VDE': 'Vanguard Energy Index Fund ETF',
+    '^VIX': 'S&P 500 Volatility Index',
+    'GC=F': 'Gold Front Month Futures',
+    'CL=F': 'Crude Oil WTI Front Month Futures',
+    'ZC=F': 'Corn Front Month Futures',
+    'EURUSD=X': 'EURO-USD',
+    'GBPUSD=X': 'GBP-USD',
+    'CNYUSD=X': 'CNY-USD',
+    'BTC-USD': 'Bitcoin-USD'
+}
+data = EA.Data(tickers = Tickers,
+                period='3y',
+                interval='1d')
+data.Collect(DataType='prices')
+all_prices = data.PriceData
+
+stats_df, decile_data = HPR_df(all_prices, '^GSPC', friday)
+# stats_df
+
+# Yield Curve - the heatmap view only draws the latest weeks at full resolution
+YieldView = 'heatmap'
+yc_dat = yield_curve(friday, dates=lod_dates(friday) if YieldView == 'heatmap' else None)
+
+# Create the pool of webdriver objects shared by the scraping workers, attaching to the warm
+# sessions of the browser service (`python browser_service.py start`) when it is running
+Workers = 4
+pool = DriverPool(drivers=attach(Workers), factory=init_browser, size=Workers)
+
+# Share the articles found by several topics so each is only scraped and summarized once
+articles = ArticleRegistry()
+
+# Share the sentences used in each topic's summary so syndicated sentences are only used once
+seen = SentenceDeduper(threshold=0.8)
+
+# Score the article summaries with TextBlob ('textblob'), VADER ('vader'), or the LM word lists
+# ('lm'), reusing the scores of any summary that was scored in an earlier run
+SentimentBackend = 'textblob'
+sentiment = sentiment_service(SentimentBackend)
+
+# Collect relevant article links using the `my_weekly_articles.py` script
+def collect_topic(si):
+    """Summarize the articles for a single topic that has already been indexed and scored."""
+    tick = si.topic
+    print(f"Collecting articles for {tick}\n\n")
+    
+    sa = mwa.summarize_articles(
+        si.asset_class, tick, pool = pool, articles = articles, si = si, seen = seen,
+        sentiment = sentiment
+    )
+    sa.go()
+    
+    index_df = sa.index_df
+    index_df = index_df.loc[
+        :10,
+        ['LMcD_Neg_Terms',  'LMcD_Pos_Terms',  'LMcD_Tot_Terms',
+         'Date_Relevance',  'Title_Relevance', 'Relevancy_Score',
+         'Source', 'Date', 'Title', 'Link', 'Polarity', 'Subjectivity']
+    ]
+    
+    ## Create column for plotly/html formatted title-link combo
+    index_df.loc[:, 'Article'] = index_df.apply(
+        lambda x: f'<a href="{x.Link}">{x.Title}</a>',
+        axis=1
+    )
+    
+    print(f"Collected articles for {tick}\n\n")
+    
+    ## Collect the asset summary
+    return [tick, index_df, sa.asset_summary]
+
+# Index the topics concurrently (skipping any duplicate tickers), score every topic's titles
+# in one batch, then summarize the topics concurrently
+topics = dict.fromkeys(zip(AsstCls + ['EQUITY'], Tickers + ['YIELD']))
+with ThreadPoolExecutor(max_workers=Workers) as executor:
+    indexes = list(executor.map(lambda job: mwa.score_index(*job, pool = pool), topics))
+    mwa.score_indexes(indexes)
+    article_dfs_lst = list(executor.map(collect_topic, indexes))
+
+pool.quit()
+print(f"Summarized {len(articles)} distinct articles\n\n")
+
+desc = open('Authors Notes.txt').read()
+
+# Profile the report payload and warn if it grows past 25MB before it is published
+profiler = ReportProfiler(max_bytes=25 * 1024 ** 2, on_exceed='warn')
+DataPane_Post(Tickers, names, all_prices, yc_dat, article_dfs_lst, desc, friday, ReportCls,
+              profiler=profiler, yield_view=YieldView)
+profiler.write('report_profile')
+
+# plotly_article_table('YIELD', article_dfs_lst)
+
+# # # ## Test the Equity_Plot function
+# e_fig = Equity_Plot(all_prices, 'BTC-USD', article_dfs_lst, names)
+
+# # # ## Test the Yield_Plot function
+# y_fig = Yield_Plot(yc_dat, article_dfs_lst)
+
+# from plotly.offline import download_plotlyjs, init_notebook_mode,  plot
+# plot(e_fig)
+# plot(y_fig)
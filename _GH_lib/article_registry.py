@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 24 18:22:06 2026.
+
+A run-scoped registry of the articles summarized for every topic in the report.
+
+Many of the topics overlap (i.e. ^GSPC, ^DJI, ^IXIC, and VTI) and their searches return the same
+articles. The first topic to claim an article collects, summarizes, and scores it, and every
+other topic that finds the same article (by canonical url or normalized title) waits for and
+reuses that result instead of scraping it again.
+
+@author: grega
+"""
+import re
+import threading
+from concurrent.futures import Future
+
+from page_cache import normalize_url
+
+def normalize_title(title):
+    """Normalize a headline so the same article from different searches shares a key."""
+    title = str(title).lower()
+    # Drop a trailing publisher name, i.e. 'Stocks rally - Reuters'
+    title = re.sub(r'\s+[-|]\s+[^-|]+$', '', title)
+    return ' '.join(re.sub(r'[^a-z0-9]+', ' ', title).split())
+
+## Define `ArticleRegistry` to share article results across topics
+class ArticleRegistry:
+    """A thread-safe map of articles to the (possibly in-flight) results of summarizing them."""
+    
+    def __init__(self):
+        """
+        Initialize an empty registry.
+        
+        Returns
+        -------
+        None.
+        
+        """
+        self.results = {}  # {key: Future}
+        self.lock    = threading.Lock()
+    
+    def keys(self, link, title=None):
+        """Return the canonical url key, and normalized title key if available, of an article."""
+        keys  = ['url:' + normalize_url(link)]
+        title = normalize_title(title) if title is not None else ''
+        if len(title.split()) >= 4:
+            keys.append('title:' + title)
+        
+        return keys
+    
+    def claim(self, link, title=None):
+        """
+        Claim an article to be summarized, or find the topic that already claimed it.
+        
+        Parameters
+        ----------
+        link : str
+            The article link.
+        title : str, optional
+            The article title. Short titles are not used as keys. The default is None.
+        
+        Returns
+        -------
+        future : concurrent.futures.Future
+            The future holding the result of summarizing the article.
+        owner : bool
+            True if the caller claimed the article and must set the result of `future`,
+            False if another topic already claimed it.
+        
+        """
+        keys = self.keys(link, title)
+        with self.lock:
+            for key in keys:
+                if key in self.results:
+                    future = self.results[key]
+                    # Also index the existing result under any keys it was missing
+                    for other in keys:
+                        self.results.setdefault(other, future)
+                    return future, False
+            
+            future = Future()
+            for key in keys:
+                self.results[key] = future
+        
+        return future, True
+    
+    def __len__(self):
+        """Return the number of distinct articles that have been claimed."""
+        with self.lock:
+            return len(set(map(id, self.results.values())))
@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Nov  2 20:31:44 2026.
+
+A long-lived local service that keeps headless, logged in browser sessions warm between runs.
+
+The service opens `size` headless browsers with `init_browser` (restoring the saved publisher
+sessions) and writes the address and session id of each to a state file. A run of the report
+then attaches to idle sessions with a RemoteWebDriver instead of starting (and logging in to)
+new browsers, and releases them again when it is done. A session is checked out by linking
+its lock file into place, so two runs never share a browser, and locks left behind by a run
+that died are reclaimed.
+
+Start the service (and stop it with Ctrl+C, or `stop` from another terminal) with
+    python browser_service.py start --size 4
+
+@author: grega
+"""
+import os
+import sys
+import json
+import time
+import signal
+import argparse
+import threading
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from init_browser import init_browser
+
+SERVICE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'browser_service')
+STATE_FILE  = os.path.join(SERVICE_DIR, 'state.json')
+
+def pid_alive(pid):
+    """Check if a process is still running."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    
+    return True
+
+def executor_url(driver):
+    """Return the address of the webdriver server a driver's session is on."""
+    return driver.command_executor._url
+
+## Define `AttachedDriver` to use a session of the service from another process
+class AttachedDriver(webdriver.Remote):
+    """A RemoteWebDriver attached to an existing session, which is released instead of closed."""
+    
+    def __init__(self, url, session_id):
+        """
+        Attach to an existing browser session.
+        
+        Parameters
+        ----------
+        url : str
+            The address of the webdriver server of the session.
+        session_id : str
+            The id of the session.
+        
+        Returns
+        -------
+        None.
+        
+        """
+        self.attached_id = session_id
+        super().__init__(command_executor=url, desired_capabilities={})
+    
+    def start_session(self, *args, **kwargs):
+        """Reuse the existing session instead of starting a new one."""
+        self.session_id   = self.attached_id
+        self.w3c          = True
+        self.capabilities = {}
+    
+    def quit(self):
+        """Release the session back to the service, leaving the browser open."""
+        release(self.attached_id)
+
+def lock_path(session_id):
+    """Return the path of the lock file of a session."""
+    return os.path.join(SERVICE_DIR, f'{session_id}.lock')
+
+def lock_owner(path):
+    """Read the pid of the process holding a lock file, or None if it can't be read."""
+    try:
+        with open(path) as f:
+            return int(f.read().strip())
+    except (OSError, ValueError):
+        return None
+
+def lock_session(session_id):
+    """
+    Check a session out by creating its lock file.
+    
+    The lock file is written in full under a temporary name and then linked into place, so it
+    is never seen without the pid of its owner. A lock whose owner is no longer running is only
+    removed while holding the session's reclaim directory, so two processes can't both reclaim
+    the same lock.
+    
+    Returns
+    -------
+    bool
+        True if the session was locked by this process, False if another running process
+        already has it.
+    
+    """
+    path = lock_path(session_id)
+    tmp  = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    with open(tmp, 'w') as f:
+        f.write(str(os.getpid()))
+    
+    try:
+        for attempt in range(2):
+            try:
+                os.link(tmp, path)
+                return True
+            except FileExistsError:
+                pass
+            
+            # Never treat a lock that can't be read as stale
+            owner = lock_owner(path)
+            if owner is None or pid_alive(owner) or not reclaim(path, owner):
+                return False
+        
+        return False
+    finally:
+        os.remove(tmp)
+
+def reclaim(path, owner):
+    """Remove the lock file of a process that is no longer running, if it still holds it."""
+    mutex = path + '.reclaim'
+    try:
+        os.mkdir(mutex)
+    except FileExistsError:
+        # Clear the reclaim directory of a process that died while reclaiming
+        try:
+            if time.time() - os.path.getmtime(mutex) > 30:
+                os.rmdir(mutex)
+        except OSError:
+            pass
+        return False
+        
+    try:
+        if lock_owner(path) != owner:
+            return False
+        os.remove(path)
+        return True
+    except OSError:
+        return False
+    finally:
+        os.rmdir(mutex)
+
+def release(session_id):
+    """Release a session that was checked out by this process."""
+    if lock_owner(lock_path(session_id)) == os.getpid():
+        try:
+            os.remove(lock_path(session_id))
+        except OSError:
+            pass
+
+def session_idle(session_id):
+    """Check if a session is not checked out, without keeping it."""
+    if not lock_session(session_id):
+        return False
+    
+    release(session_id)
+    return True
+
+def read_state():
+    """Read the sessions of the service, or None if the service is not running."""
+    try:
+        with open(STATE_FILE) as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    return state if pid_alive(state.get('pid', 0)) else None
+
+def attach(count):
+    """
+    Attach to (up to) `count` idle sessions of the service.
+    
+    Parameters
+    ----------
+    count : int
+        The number of sessions wanted.
+    
+    Returns
+    -------
+    list
+        An `AttachedDriver` for each session that could be checked out. Empty if the service
+        is not running or every session is in use.
+    
+    """
+    state   = read_state()
+    drivers = []
+    for session in (state or {}).get('sessions', []):
+        if len(drivers) == count:
+            break
+        if not lock_session(session['id']):
+            continue
+        
+        # Make sure the browser is still open before handing it out
+        try:
+            driver = AttachedDriver(session['url'], session['id'])
+            driver.current_url
+        except WebDriverException:
+            release(session['id'])
+            continue
+        drivers.append(driver)
+    
+    return drivers
+
+def attach_driver():
+    """Attach to one idle session of the service, or return None if there are none."""
+    drivers = attach(1)
+    return drivers[0] if len(drivers) > 0 else None
+
+## Define `BrowserService` to open the browsers and keep them warm
+class BrowserService:
+    """The process that owns the warm browser sessions."""
+    
+    def __init__(self, size=4, keepalive=60):
+        """
+        Initialize the service.
+        
+        Parameters
+        ----------
+        size : int, optional
+            The number of browser sessions to keep open. The default is 4.
+        keepalive : float, optional
+            The number of seconds between checks that the idle sessions are still open.
+            The default is 60.
+        
+        Returns
+        -------
+        None.
+        
+        """
+        self.size      = size
+        self.keepalive = keepalive
+        self.drivers   = []
+    
+    def open(self):
+        """Open a new headless, logged in browser."""
+        return init_browser(headless=True, interactive=False)
+    
+    def write_state(self):
+        """Write the address and session id of every browser to the state file."""
+        state = dict(
+            pid=os.getpid(),
+            sessions=[dict(id=d.session_id, url=executor_url(d)) for d in self.drivers],
+        )
+        with open(STATE_FILE + '.tmp', 'w') as f:
+            json.dump(state, f)
+        os.replace(STATE_FILE + '.tmp', STATE_FILE)
+    
+    def check(self):
+        """Replace any idle browser that has been closed or crashed."""
+        replaced = False
+        for i, driver in enumerate(self.drivers):
+            if not lock_session(driver.session_id):
+                # The session is checked out by a run
+                continue
+            try:
+                driver.current_url
+            except WebDriverException:
+                try:
+                    driver.quit()
+                except WebDriverException:
+                    pass
+                self.drivers[i] = self.open()
+                replaced = True
+            finally:
+                release(driver.session_id)
+        
+        if replaced:
+            self.write_state()
+    
+    def serve(self):
+        """Open the browsers and keep them open until the service is stopped."""
+        if read_state() is not None:
+            print('The browser service is already running')
+            return
+        
+        os.makedirs(SERVICE_DIR, mode=0o700, exist_ok=True)
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        
+        try:
+            while len(self.drivers) < self.size:
+                self.drivers.append(self.open())
+            self.write_state()
+            print(f'Serving {len(self.drivers)} browser sessions')
+            
+            while True:
+                time.sleep(self.keepalive)
+                self.check()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+    
+    def stop(self):
+        """Close every browser and remove the state and lock files."""
+        for driver in self.drivers:
+            try:
+                driver.quit()
+            except WebDriverException:
+                pass
+            try:
+                os.remove(lock_path(driver.session_id))
+            except OSError:
+                pass
+        self.drivers = []
+        
+        try:
+            os.remove(STATE_FILE)
+        except OSError:
+            pass
+
+def main():
+    """Start, stop, or check the status of the browser service from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument('command', choices=['start', 'stop', 'status'])
+    parser.add_argument('--size', type=int, default=4, help='The number of browser sessions')
+    parser.add_argument('--keepalive', type=float, default=60, help='Seconds between checks')
+    args = parser.parse_args()
+    
+    state = read_state()
+    if args.command == 'start':
+        BrowserService(args.size, args.keepalive).serve()
+    elif state is None:
+        print('The browser service is not running')
+    elif args.command == 'stop':
+        os.kill(state['pid'], signal.SIGTERM)
+    else:
+        idle = [s for s in state['sessions'] if session_idle(s['id'])]
+        print(f"Serving {len(state['sessions'])} browser sessions, {len(idle)} idle")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Nov  1 16:08:27 2026.
+
+Parse the publishing dates found on the search pages into dates.
+
+Relative dates (i.e. '5 hours ago', 'Yesterday', '3 days ago', 'Tuesday') are matched with one
+compiled pattern and resolved against the week anchors (today, and this week's monday and
+friday), which are computed once when the parser is created. Absolute dates are tried against
+a table of formats, and the (whole string) format that worked for a source is tried first for
+the next date from that source. Each distinct date string is only parsed once.
+
+@author: grega
+"""
+import re
+import threading
+import datetime as dt
+
+import pandas as pd
+
+from mwr_utils import my_str_to_date, EndOfWeek
+
+WEEKDAYS = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+
+# The relative dates, with the words for the time since the article was published
+RELATIVE = re.compile(
+    r'(?P<today>\btoday\b|\bjust now\b|'
+    r'\b\d+\s*(?:seconds?|secs?|minutes?|mins?|hours?|hrs?)\s+ago\b)|'
+    r'(?P<yesterday>\byesterday\b)|'
+    r'\b(?P<days>\d{1,2})\s*days?\s+ago\b|'
+    r'\b(?P<weekday>' + '|'.join(WEEKDAYS) + r')\b',
+    flags=re.IGNORECASE,
+)
+
+# The absolute date formats, and the number of characters at the end of the string they are
+# matched to (None for the whole string), in the order they are tried
+FORMATS = [
+    ('%Y-%m-%d', None),
+    ('%b %d, %Y', 12),
+    ('%a, %b. %d', 12),
+    ('%a, %B %d', 12),
+    ('%a, %B %d', 11),
+    ('%b %d, %Y', 13),
+    ('%B %d, %Y', None),
+    ('%a, %B %d', None),
+    ('%a, %b %d', None),
+    ('%B %d', None),
+    ('%b %d', None),
+    # Let pandas infer any other format
+    (None, None),
+    (None, 12),
+    (None, 11),
+    (None, 13),
+]
+
+## Define `DateParser` to convert the date strings of an article index
+class DateParser:
+    """A memoized parser of relative and absolute publishing dates."""
+    
+    def __init__(self, today=None):
+        """
+        Initialize the parser and the week anchors.
+        
+        Parameters
+        ----------
+        today : dt.date, optional
+            The date relative dates are resolved against. The default is None, which will use
+            today's date and this week's monday and friday.
+        
+        Returns
+        -------
+        None.
+        
+        """
+        if today is None:
+            self.today  = dt.date.today()
+            self.monday = my_str_to_date(EndOfWeek(True)[0])
+            self.friday = my_str_to_date(EndOfWeek(True)[1])
+        else:
+            self.today  = today
+            self.monday = today - dt.timedelta(days=today.weekday())
+            self.friday = self.monday + dt.timedelta(days=4)
+        
+        self.memo    = {}  # {date string: date}
+        self.learned = {}  # {source: index in FORMATS of the last whole string format that worked}
+        self.lock    = threading.Lock()
+    
+    def relative(self, string):
+        """Resolve a relative date against the week anchors, or None if it is not relative."""
+        match = RELATIVE.search(string)
+        if match is None:
+            return None
+        
+        if match.lastgroup == 'today':
+            return self.today
+        elif match.lastgroup == 'yesterday':
+            return self.today - dt.timedelta(days=1)
+        elif match.lastgroup == 'days':
+            return self.today - dt.timedelta(days=int(match.group('days')))
+        
+        # Weekdays are in this week, except sunday which is the day before monday
+        offset = WEEKDAYS.index(match.group('weekday').lower())
+        return self.monday + dt.timedelta(days=offset if offset < 6 else -1)
+    
+    def absolute(self, string, source=None):
+        """Parse an absolute date, trying the last format that worked for `source` first."""
+        first = self.learned.get(source)
+        order = ([first] if first is not None else []) + \
+                [i for i in range(len(FORMATS)) if i != first]
+        
+        for i in order:
+            fmt, length = FORMATS[i]
+            part = string if length is None else string[-length:]
+            try:
+                date = dt.datetime.strptime(part, fmt) if fmt is not None else pd.to_datetime(part)
+            except (ValueError, TypeError, OverflowError):
+                continue
+            if pd.isna(date):
+                continue
+            
+            # Only learn the formats that match the whole string, so a lenient slice or pandas
+            # guess is never tried before the strict formats for the next date from the source
+            if fmt is not None and length is None:
+                with self.lock:
+                    self.learned[source] = i
+            
+            date = date.date()
+            # Dates without a year are parsed into 1900 (or year 1 by pandas)
+            if date.year <= 1900:
+                date = dt.date(self.today.year, date.month, date.day)
+            
+            return date
+        
+        return None
+    
+    def parse(self, string, source=None):
+        """
+        Convert a date string into a date.
+        
+        Parameters
+        ----------
+        string : str
+            The date string, i.e. '3 hours ago', 'Tue, Mar. 8', or 'Mar 8, 2022'.
+        source : str, optional
+            The source (publisher) the date was found for. The default is None.
+        
+        Returns
+        -------
+        dt.date
+            The date. Strings that can't be parsed are dated today.
+        
+        """
+        string = str(string).strip()
+        if string in self.memo:
+            return self.memo[string]
+        
+        date = self.relative(string)
+        if date is None:
+            date = self.absolute(string, source)
+        if date is None:
+            print(f'Could not parse the date {string}, using today')
+            date = self.today
+        
+        self.memo[string] = date
+        
+        return date
+    
+    def parse_all(self, strings, sources=None):
+        """Convert a list of date strings (each found for the matching source) into dates."""
+        sources = [None] * len(strings) if sources is None else sources
+        return [self.parse(string, source) for string, source in zip(strings, sources)]
+
+# The parser shared by every topic in the run
+date_parser = DateParser()
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Wed Oct 28 20:05:47 2026.
+
+Find near-duplicate sentences with MinHash signatures and locality-sensitive hashing (LSH).
+
+Syndicated wire copy (i.e. AP and Reuters republished by Yahoo, Nasdaq, and others) repeats the
+same sentences, with small edits, across many articles and topics. Each sentence is reduced to a
+MinHash signature of its word shingles, and the signature is split into bands that are hashed
+into buckets. Only the sentences that share a bucket with a new sentence are compared to it, so
+checking a sentence against everything seen so far takes roughly constant time.
+
+@author: grega
+"""
+import re
+import zlib
+import threading
+
+import numpy as np
+
+# A Mersenne prime larger than any shingle hash, for the universal hash functions
+MERSENNE = (1 << 31) - 1
+
+def shingles(sentence, k=3):
+    """Return the set of `k` word shingles of a sentence, or the whole sentence if it's shorter."""
+    words = sentence.split() if isinstance(sentence, str) else sentence
+    words = [w for w in (re.sub(r'[^a-z0-9]+', '', w.lower()) for w in words) if w != '']
+    if len(words) <= k:
+        return {' '.join(words)} if len(words) > 0 else set()
+    
+    return {' '.join(words[i:i + k]) for i in range(len(words) - k + 1)}
+
+def lsh_bands(threshold, num_perm):
+    """
+    Choose the number of bands and rows per band of the LSH index for a similarity threshold.
+    
+    Two sentences with a similarity of `s` share at least one bucket with probability
+    1 - (1 - s^rows)^bands, which rises most steeply around (1 / bands)^(1 / rows).
+    
+    """
+    return min(
+        ((num_perm // rows, rows) for rows in range(1, num_perm + 1)),
+        key=lambda band: abs((1 / band[0]) ** (1 / band[1]) - threshold),
+    )
+
+## Define `SentenceDeduper` to keep only the first of each group of near-duplicate sentences
+class SentenceDeduper:
+    """A thread-safe LSH index of the sentences kept so far."""
+    
+    def __init__(self, threshold=0.8, num_perm=64, k=3, seed=1):
+        """
+        Initialize an empty index.
+        
+        Parameters
+        ----------
+        threshold : float, optional
+            The (estimated Jaccard) similarity of the word shingles of two sentences at which
+            they are near-duplicates. The default is 0.8.
+        num_perm : int, optional
+            The number of hash functions in each MinHash signature. The default is 64.
+        k : int, optional
+            The number of words in each shingle. The default is 3.
+        seed : int, optional
+            The seed of the hash functions. The default is 1.
+        
+        Returns
+        -------
+        None.
+        
+        """
+        rng = np.random.RandomState(seed)
+        
+        self.threshold   = threshold
+        self.k           = k
+        self.a           = rng.randint(1, MERSENNE, num_perm).astype(np.int64)
+        self.b           = rng.randint(0, MERSENNE, num_perm).astype(np.int64)
+        self.bands, rows = lsh_bands(threshold, num_perm)
+        self.rows        = rows
+        self.signatures  = []
+        self.buckets     = {}  # {(band, band signature): [signature id]}
+        self.lock        = threading.Lock()
+    
+    def signature(self, sentence):
+        """Return the MinHash signature of a sentence, or None if it has no words."""
+        grams = shingles(sentence, self.k)
+        if len(grams) == 0:
+            return None
+        
+        hashes = np.array([zlib.crc32(g.encode()) for g in grams], dtype=np.int64) % MERSENNE
+        return ((self.a[:, None] * hashes[None, :] + self.b[:, None]) % MERSENNE).min(axis=1)
+    
+    def band_keys(self, signature):
+        """Return the bucket of each band of a signature."""
+        return [
+            (band, signature[band * self.rows:(band + 1) * self.rows].tobytes())
+            for band in range(self.bands)
+        ]
+    
+    def duplicate(self, sentence, add=True):
+        """
+        Check if a sentence is a near-duplicate of a sentence that was already kept.
+        
+        Parameters
+        ----------
+        sentence : str or list
+            The sentence, or a list of its words.
+        add : bool, optional
+            If True, and the sentence is not a near-duplicate, it is kept so later sentences
+            are checked against it. The default is True.
+        
+        Returns
+        -------
+        bool
+            True if the sentence is a near-duplicate. Sentences with no words never are.
+        
+        """
+        signature = self.signature(sentence)
+        if signature is None:
+            return False
+        
+        keys = self.band_keys(signature)
+        with self.lock:
+            # Only compare the signatures that share a bucket with this sentence
+            candidates = {i for key in keys for i in self.buckets.get(key, [])}
+            for i in candidates:
+                if np.mean(self.signatures[i] == signature) >= self.threshold:
+                    return True
+            
+            if add:
+                for key in keys:
+                    self.buckets.setdefault(key, []).append(len(self.signatures))
+                self.signatures.append(signature)
+        
+        return False
+    
+    def filter(self, sentences):
+        """Keep the sentences that are not near-duplicates of any sentence kept before them."""
+        return [sentence for sentence in sentences if not self.duplicate(sentence)]
+    
+    def __len__(self):
+        """Return the number of sentences kept."""
+        with self.lock:
+            return len(self.signatures)
@@ -1,150 +1,285 @@
-# -*- coding: utf-8 -*-
-"""
-Created on Thu Feb 10 18:43:07 2022
-
-@author: grega
-"""
-import sys
-import os
-import datetime as dt
-import pandas as pd
-from equity_plot import Equity_Plot
-from mwr_utils import my_topic
-from yield_plot import Yield_Plot
-import datapane as dp
-from mwr_utils import my_date_to_str
-
-sys.path.append('')
-idx = pd.IndexSlice
-dp.login(token=os.environ.get("DataPane Token"))
-
-## Define `DataPane_Post` function to create and stitch together the interactive charts
-## for each benchmark
-def DataPane_Post(Tickers, Names, Price_df, Yield_df, Articles_lst, desc, friday):
-    """
-    Publish the visuals to DataPane as multi-page report.
-    
-    Parameters
-    ----------
-    Tickers : list
-        The list of equity/commodity/fx tickers being reported on.
-    Names : dict
-        A dictionary with the relevant Tickers as keys and their corresponding names as values.
-    Price_df : pd.DataFrame
-        The full dataframe of closing prices for each asset being reported on.
-    Yield_df : pd.DataFrame
-        The dataframe of treasury yields used in the yield-curve plot.
-    Articles_lst : list
-        The list of article summaries for each asset being reported on.
-        
-    Yields
-    ------
-    None.
-    
-    """
-    ## Create the list of figures and page titles to add to DP report
-    fig_lst = list()
-    tit_lst = list()
-    sum_lst = list()
-    prc_lst = list()
-    
-    # Start with equity plots
-    for i, tick in enumerate(Tickers):
-        # Create the equity plot figure
-        ohlc_fig, scnd_fig = Equity_Plot(Price_df, tick, Articles_lst, Names, friday)
-        fig_lst.append([ohlc_fig, scnd_fig])
-        # Add the topic/title string
-        tit_lst.append(my_topic(tick))
-        # Add the summary article
-        sum_lst.append(Articles_lst[i][2])
-        # Add the current day's price and 1-day return
-        last_price = Price_df.loc[:, idx[['PCT_Change', 'Adj Close'], tick]].copy()
-        last_price.dropna(inplace = True)
-        lst_date = str(last_price.iloc[-1, :].name.date()) + ' 1-Day Ret.'
-        lst_prce = f"${last_price.iloc[-1, :]['Adj Close'].values[0]:,.2f}"
-        pct_chng = last_price.iloc[-1, :]['PCT_Change'].values[0]
-        is_upchg = True if pct_chng > 0 else False
-        pct_chng = f"{pct_chng:,.2f}%"
-        prc_lst.append([lst_date, lst_prce, pct_chng, is_upchg])
-        
-    # Add yield curve
-    y_fig = Yield_Plot(Yield_df, Articles_lst, friday)
-    fig_lst.append(y_fig)
-    tit_lst.append(my_topic('YIELD'))
-    sum_lst.append(Articles_lst[-1][2])
-    prc_lst.append([])
-    
-    # Create list of `dp.Page` args
-    page_args = []
-    for figs, title, summary, big_n in zip(fig_lst, tit_lst, sum_lst, prc_lst):
-        if big_n != []:
-            page_args.append(
-                dp.Page(
-                    title=title.replace('SP', 'S&P'),
-                    blocks=[
-                        f"## {title.replace('SP', 'S&P')}",
-                        dp.Group(
-                            dp.BigNumber(
-                                heading          = big_n[0],
-                                value            = big_n[1],
-                                change           = big_n[2],
-                                is_upward_change = big_n[3]
-                            ),
-                            dp.HTML('<p> </p>'),
-                            columns = 2
-                        ),
-                        '### Prices - OHLC Chart',
-                        figs[0],
-                        '### Summary Data & Relevant Articles',
-                        figs[1],
-                        '## NLG Summary of Weekly Events\n\n' + summary + '\n\n' + desc
-                    ]
-                )
-            )
-        else:
-            page_args.append(
-                dp.Page(
-                    title=title.replace('SP', 'S&P'),
-                    blocks=[
-                        f"## {title.replace('SP', 'S&P')}",
-                        figs,
-                        '## NLG Summary of Weekly Events\n\n' + summary + '\n\n' + desc
-                    ]
-                )
-            )
-        
-    report_dates = [
-        my_date_to_str(friday + dt.timedelta(days=-7), [True, False]), my_date_to_str(friday, [True, True])
-    ]
-    report_title = "Financial Markets Update"
-    report_descr = ' to '.join(report_dates)
-    
-    # Create the DataPane report
-    dp.enable_logging()
-    r = dp.Report(
-        # report_title,
-        # report_descr,
-        page_args[0],
-        page_args[1],
-        page_args[2],
-        page_args[3],
-        page_args[4],
-        page_args[5],
-        page_args[6],
-        page_args[7],
-        page_args[8],
-        page_args[9],
-        page_args[10],
-        page_args[11],
-        page_args[12],
-        page_args[13],
-        page_args[14],
-    )
-    
-    r.upload(
-        name        = report_title,
-        open        = True,
-        description = report_descr,
-        publicly_visible = True,
-        formatting  = dp.ReportFormatting(width=dp.ReportWidth.FULL)
-    )
+# -*- coding: utf-8 -*-
+"""
+Created on Thu Feb 10 18:43:07 2022
+
+@author: grega
+"""
+import sys
+import os
+import datetime as dt
+import pandas as pd
+from equity_plot import Equity_Plot
+from mwr_utils import my_topic
+from yield_plot import Yield_Plot
+import datapane as dp
+from mwr_utils import my_date_to_str
+from report_profiler import profiled
+
+sys.path.append('')
+idx = pd.IndexSlice
+dp.login(token=os.environ.get("DataPane Token"))
+
+## Define `asset_page` to build the report page for a single equity/commodity/fx asset
+def asset_page(tick, Names, Price_df, Articles_lst, summary, desc, friday, profiler=None):
+    """
+    Create the `dp.Page` for a single asset.
+    
+    Parameters
+    ----------
+    tick : str
+        The ticker of the asset the page is being made for.
+    Names : dict
+        A dictionary with the relevant Tickers as keys and their corresponding names as values.
+    Price_df : pd.DataFrame
+        The full dataframe of closing prices for each asset being reported on.
+    Articles_lst : list
+        The list of article summaries for each asset being reported on.
+    summary : str
+        The NLG summary of the weekly events for this asset.
+    desc : str
+        The authors notes appended to the end of each page.
+    friday : dt.date
+        The friday of the week being reported on.
+    profiler : ReportProfiler, optional
+        Records the payload of the page's figures if provided. The default is None.
+        
+    Returns
+    -------
+    dp.Page
+        The finished report page.
+        
+    """
+    # Create the equity plot figures
+    ohlc_fig, scnd_fig = profiled(
+        profiler, tick, 'Equity_Plot', Equity_Plot,
+        Price_df, tick, Articles_lst, Names, friday, profiler=profiler
+    )
+    title = page_title(tick, Names)
+    
+    # Collect the current day's price and 1-day return
+    last_price = Price_df.loc[:, idx[['PCT_Change', 'Adj Close'], tick]].copy()
+    last_price.dropna(inplace = True)
+    lst_date = str(last_price.iloc[-1, :].name.date()) + ' 1-Day Ret.'
+    lst_prce = f"${last_price.iloc[-1, :]['Adj Close'].values[0]:,.2f}"
+    pct_chng = last_price.iloc[-1, :]['PCT_Change'].values[0]
+    is_upchg = True if pct_chng > 0 else False
+    pct_chng = f"{pct_chng:,.2f}%"
+    
+    text = '## NLG Summary of Weekly Events\n\n' + summary + '\n\n' + desc
+    if profiler is not None:
+        profiler.record(tick, 'Summary Text', text)
+    
+    return dp.Page(
+        title=title,
+        blocks=[
+            f"## {title}",
+            dp.Group(
+                dp.BigNumber(
+                    heading          = lst_date,
+                    value            = lst_prce,
+                    change           = pct_chng,
+                    is_upward_change = is_upchg
+                ),
+                dp.HTML('<p> </p>'),
+                columns = 2
+            ),
+            '### Prices - OHLC Chart',
+            ohlc_fig,
+            '### Summary Data & Relevant Articles',
+            scnd_fig,
+            text
+        ]
+    )
+
+## Define `yield_page` to build the report page for the US yield curve
+def yield_page(Yield_df, Articles_lst, summary, desc, friday, profiler=None, view='surface'):
+    """Create the `dp.Page` for the US yield curve, drawn with the given `Yield_Plot` view."""
+    y_fig = profiled(
+        profiler, 'YIELD', 'Yield_Plot', Yield_Plot,
+        Yield_df, Articles_lst, friday, profiler=profiler, view=view
+    )
+    title = page_title('YIELD')
+    
+    text = '## NLG Summary of Weekly Events\n\n' + summary + '\n\n' + desc
+    if profiler is not None:
+        profiler.record('YIELD', 'Summary Text', text)
+    
+    return dp.Page(
+        title=title,
+        blocks=[
+            f"## {title}",
+            y_fig,
+            text
+        ]
+    )
+
+def page_title(tick, Names=None):
+    """Determine the page title for an asset, falling back to its name if it has no topic."""
+    try:
+        title = my_topic(tick)
+    except KeyError:
+        title = (Names or {}).get(tick, tick)
+    return title.replace('SP', 'S&P')
+
+## Define `iter_pages` to lazily build the report pages grouped by asset class
+def iter_pages(Tickers, Names, Price_df, Yield_df, Articles_lst, desc, friday,
+               AsstCls=None, yield_class='FI', profiler=None, yield_view='surface'):
+    """
+    Build the report pages one at a time, grouped by asset class.
+    
+    Pages are yielded as soon as their figures are finished so the caller never needs to hold
+    the figures for the entire asset universe in memory at once.
+    
+    Parameters
+    ----------
+    Tickers : list
+        The list of equity/commodity/fx tickers being reported on.
+    Names : dict
+        A dictionary with the relevant Tickers as keys and their corresponding names as values.
+    Price_df : pd.DataFrame
+        The full dataframe of closing prices for each asset being reported on.
+    Yield_df : pd.DataFrame or None
+        The dataframe of treasury yields used in the yield-curve plot.
+        If None, no yield curve page will be created.
+    Articles_lst : list
+        The list of `[tick, index_df, asset_summary]` article results for each asset.
+    desc : str
+        The authors notes appended to the end of each page.
+    friday : dt.date
+        The friday of the week being reported on.
+    AsstCls : list, optional
+        The asset class of each ticker in `Tickers`. The default is None, which will treat
+        every ticker as an equity.
+    yield_class : str, optional
+        The asset class the yield curve page is grouped with. The default is 'FI'.
+    profiler : ReportProfiler, optional
+        Records the payload of each page's figures if provided. The default is None.
+    yield_view : str, optional
+        The `Yield_Plot` view, 'surface' or 'heatmap', of the yield curve page.
+        The default is 'surface'.
+        
+    Yields
+    ------
+    tuple
+        The asset class, the ticker, and the finished `dp.Page`.
+        
+    """
+    AsstCls = ['EQUITY'] * len(Tickers) if AsstCls is None else AsstCls
+    
+    # Look up article summaries by ticker rather than assuming they line up with `Tickers`
+    summaries = {art[0]: art[2] for art in Articles_lst}
+    
+    # Order the assets by asset class while keeping the order they were passed in
+    classes = list(dict.fromkeys(AsstCls))
+    if Yield_df is not None and yield_class not in classes:
+        classes.append(yield_class)
+    
+    for asset_class in classes:
+        for tick, tick_class in zip(Tickers, AsstCls):
+            if tick_class == asset_class:
+                yield asset_class, tick, asset_page(
+                    tick, Names, Price_df, Articles_lst, summaries.get(tick, ''), desc, friday,
+                    profiler
+                )
+                
+        if Yield_df is not None and asset_class == yield_class:
+            yield asset_class, 'YIELD', yield_page(
+                Yield_df, Articles_lst, summaries.get('YIELD', ''), desc, friday, profiler,
+                yield_view
+            )
+
+## Define `DataPane_Post` function to create and stitch together the interactive charts
+## for each benchmark
+def DataPane_Post(Tickers, Names, Price_df, Yield_df, Articles_lst, desc, friday,
+                  AsstCls=None, max_pages=15, profiler=None, yield_view='surface'):
+    """
+    Publish the visuals to DataPane as one or more multi-page reports.
+    
+    If every page fits within `max_pages` a single report is published. Otherwise a separate
+    report is published for each asset class, split into parts of at most `max_pages` pages.
+    Each report is uploaded as soon as it is full, so only `max_pages` pages are ever held
+    in memory. If a `profiler` is passed, each report is checked against its byte budget
+    before it is uploaded.
+    
+    Parameters
+    ----------
+    Tickers : list
+        The list of equity/commodity/fx tickers being reported on.
+    Names : dict
+        A dictionary with the relevant Tickers as keys and their corresponding names as values.
+    Price_df : pd.DataFrame
+        The full dataframe of closing prices for each asset being reported on.
+    Yield_df : pd.DataFrame
+        The dataframe of treasury yields used in the yield-curve plot.
+    Articles_lst : list
+        The list of article summaries for each asset being reported on.
+    desc : str
+        The authors notes appended to the end of each page.
+    friday : dt.date
+        The friday of the week being reported on.
+    AsstCls : list, optional
+        The asset class of each ticker in `Tickers`. The default is None.
+    max_pages : int, optional
+        The maximum number of pages in a single report. The default is 15.
+    profiler : ReportProfiler, optional
+        Records the payload of the report and enforces its byte budget. The default is None.
+    yield_view : str, optional
+        The `Yield_Plot` view, 'surface' or 'heatmap', of the yield curve page.
+        The default is 'surface'.
+        
+    Yields
+    ------
+    None.
+    
+    """
+    report_dates = [
+        my_date_to_str(friday + dt.timedelta(days=-7), [True, False]), my_date_to_str(friday, [True, True])
+    ]
+    report_title = "Financial Markets Update"
+    report_descr = ' to '.join(report_dates)
+    
+    # Determine if the report needs to be split up by asset class
+    n_pages  = len(Tickers) + (0 if Yield_df is None else 1)
+    split_up = n_pages > max_pages
+    
+    def upload(pages, ticks, name):
+        """Create the DataPane report for the given pages (of the given tickers) and upload it."""
+        if profiler is not None:
+            profiler.check(ticks)
+        r = dp.Report(*pages)
+        r.upload(
+            name        = name,
+            open        = True,
+            description = report_descr,
+            publicly_visible = True,
+            formatting  = dp.ReportFormatting(width=dp.ReportWidth.FULL)
+        )
+    
+    def report_name(asset_class, part):
+        """Create the report name for the given asset class and part number."""
+        if not split_up:
+            return report_title
+        name = f"{report_title} | {asset_class.title()}"
+        return name if part == 1 else f"{name} ({part})"
+    
+    # Stream the pages into reports, uploading each report as soon as it is full
+    dp.enable_logging()
+    pages, ticks, current_class, part = [], [], None, 1
+    for asset_class, tick, page in iter_pages(
+            Tickers, Names, Price_df, Yield_df, Articles_lst, desc, friday, AsstCls,
+            profiler=profiler, yield_view=yield_view
+    ):
+        if split_up and pages and asset_class != current_class:
+            upload(pages, ticks, report_name(current_class, part))
+            pages, ticks, part = [], [], 1
+            
+        elif len(pages) == max_pages:
+            upload(pages, ticks, report_name(current_class, part))
+            pages, ticks, part = [], [], part + 1
+            
+        current_class = asset_class
+        pages.append(page)
+        ticks.append(tick)
+        
+    if pages:
+        upload(pages, ticks, report_name(current_class, part))
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Fri Oct 23 20:48:31 2026.
+
+Extract the article index and article paragraphs from a page with an html parser.
+
+Each page is parsed once with `lxml` and the elements needed are selected with the XPath
+selectors registered for each source and publisher in `scrape_patterns.registry`, instead of
+rescanning the raw page source with a non-greedy regular expression per element.
+
+If `lxml` is not installed, a source/publisher has no selectors, or its selectors match
+nothing on the page (i.e. after a change to the publisher's markup), every function returns
+None so the caller can fall back to the regular expressions.
+
+@author: grega
+"""
+from functools import lru_cache
+
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:
+    lxml = None
+
+@lru_cache(maxsize=None)
+def xpath(path):
+    """Compile an XPath selector once and reuse it for every page."""
+    return etree.XPath(path)
+
+def parse(page):
+    """Parse a page source into an html tree, or None if it can't be parsed."""
+    try:
+        return lxml.html.fromstring(page)
+    except (etree.ParserError, ValueError):
+        return None
+
+def node_text(node):
+    """Return the cleaned up text of an element, or the value of an attribute."""
+    text = node.text_content() if hasattr(node, 'text_content') else str(node)
+    return ' '.join(text.split())
+
+def first_text(card, path):
+    """Return the text of the first non-empty match of `path` within `card`, or None."""
+    if path is None:
+        return None
+    
+    for node in xpath(path)(card):
+        text = node_text(node)
+        if text != '':
+            return text
+    
+    return None
+
+## Define `index_cards` to collect every article on a search page in one pass
+def index_cards(page, xpaths):
+    """
+    Collect the title, link, date, and publisher of each article card on a search page.
+    
+    Parameters
+    ----------
+    page : str
+        The page source of the search page.
+    xpaths : dict
+        The XPath selectors of the source, see `scrape_patterns.PatternRegistry.register_source`.
+    
+    Returns
+    -------
+    list or None
+        A dict with the `title`, `link`, `date`, and `publisher` of each article card. Items
+        that could not be found are None. None if the page can't be parsed with `lxml` or
+        no article cards are found.
+    
+    """
+    if lxml is None or xpaths is None:
+        return None
+    
+    tree = parse(page)
+    if tree is None:
+        return None
+    
+    cards = xpath(xpaths['card'])(tree)
+    if len(cards) == 0:
+        return None
+    
+    return [
+        {key: first_text(card, xpaths.get(key)) for key in ['title', 'link', 'date', 'publisher']}
+        for card in cards
+    ]
+
+## Define `paragraphs` to collect the text of an article in one pass
+def paragraphs(page, path):
+    """
+    Collect the paragraphs of an article.
+    
+    Headings and list items end with a period so they are split into their own sentences.
+    Elements nested in an element that was already collected are skipped.
+    
+    Parameters
+    ----------
+    page : str
+        The page source of the article.
+    path : str
+        The XPath selector of the paragraphs of the publisher.
+    
+    Returns
+    -------
+    list or None
+        The text of each paragraph in the order they appear in the article.
+        None if the page can't be parsed with `lxml` or no paragraphs are found.
+    
+    """
+    if lxml is None or path is None:
+        return None
+    
+    tree = parse(page)
+    if tree is None:
+        return None
+    
+    texts, seen = [], set()
+    for node in xpath(path)(tree):
+        seen.add(node)
+        if any(parent in seen for parent in node.iterancestors()):
+            continue
+        
+        text = node_text(node)
+        if text != '' and node.tag in ['li', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
+            text += '.'
+        texts.append(text)
+    
+    return texts if any(text != '' for text in texts) else None
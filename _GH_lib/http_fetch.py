@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Tue Oct 20 19:41:07 2026.
+
+Collect article pages over plain HTTP instead of driving a full browser for each one.
+
+Most of the articles linked from a Google News search are server rendered, so a single
+asyncio event loop with a pooled `aiohttp` session can collect all of them concurrently.
+Redirects are followed to resolve the `news.google.com/articles/...` links, cookies are kept
+in a shared cookie jar, and the number of concurrent requests to a single host is limited.
+
+Any page that can't be collected this way (JS-only redirects, paywalled publishers that need
+the logged in browser, or errors) is returned as None so the caller can fall back to selenium.
+
+@author: grega
+"""
+import re
+import html
+import asyncio
+import threading
+from functools import partial
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from rate_limit import scheduler as shared_scheduler
+
+# Publishers that need the logged in selenium browser (paywalls) or JS rendering
+BROWSER_DOMAINS = {
+    'news.google.com', 'consent.google.com', 'wsj.com', 'nytimes.com', 'bloomberg.com',
+    'seekingalpha.com'
+}
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:105.0) Gecko/20100101 Firefox/105.0',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+}
+
+def needs_browser(url):
+    """Determine if a url belongs to a publisher that must be collected with selenium."""
+    host = (urlsplit(url).hostname or '').lower()
+    return any(host == domain or host.endswith('.' + domain) for domain in BROWSER_DOMAINS)
+
+async def fetch_page(session, url, timeout, scheduler):
+    """
+    Collect a single page with an open `aiohttp` session.
+    
+    Parameters
+    ----------
+    session : aiohttp.ClientSession
+        The shared client session.
+    url : str
+        The page url.
+    timeout : float
+        The total number of seconds to wait for the page.
+    scheduler : rate_limit.DomainScheduler
+        The scheduler pacing the requests to each domain.
+    
+    Returns
+    -------
+    dict or None
+        The page source, resolved url, page title, and domain of the page.
+        None if the page needs to be collected with selenium.
+    
+    """
+    await scheduler.delay(url)
+    try:
+        async with session.get(url, allow_redirects=True, timeout=aiohttp.ClientTimeout(total=timeout)) as resp:
+            # Back off from publishers that are throttling or struggling
+            if resp.status in [429, 503]:
+                retry_after = resp.headers.get('Retry-After', '')
+                scheduler.penalize(url, float(retry_after) if retry_after.isdigit() else None)
+                return None
+            
+            scheduler.reward(url)
+            if resp.status != 200 or 'html' not in resp.headers.get('Content-Type', ''):
+                return None
+            
+            resolved = str(resp.url)
+            if needs_browser(resolved):
+                return None
+            
+            page = await resp.text(errors='replace')
+    
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        scheduler.penalize(url)
+        return None
+    except (UnicodeDecodeError, ValueError):
+        return None
+    
+    title = re.search('<title[^>]*>(.*?)</title>', page, flags=re.S | re.I)
+    title = html.unescape(title.group(1)).strip() if title is not None else ''
+    
+    return dict(page=page, url=resolved, title=title, domain=resp.url.host)
+
+async def fetch_all(urls, per_host, limit, timeout, scheduler):
+    """Collect every url concurrently through one pooled session and cookie jar."""
+    connector = aiohttp.TCPConnector(limit=limit, limit_per_host=per_host)
+    async with aiohttp.ClientSession(
+            connector=connector, cookie_jar=aiohttp.CookieJar(), headers=HEADERS
+    ) as session:
+        return await asyncio.gather(*[fetch_page(session, url, timeout, scheduler) for url in urls])
+
+def fetch_pages(urls, per_host=4, limit=32, timeout=15, scheduler=shared_scheduler):
+    """
+    Collect pages over HTTP concurrently.
+    
+    Parameters
+    ----------
+    urls : list
+        The page urls to collect.
+    per_host : int, optional
+        The maximum number of concurrent connections to a single host. The default is 4.
+    limit : int, optional
+        The maximum number of concurrent connections in total. The default is 32.
+    timeout : float, optional
+        The total number of seconds to wait for each page. The default is 15.
+    scheduler : rate_limit.DomainScheduler, optional
+        The scheduler pacing the requests to each domain. The default is the shared scheduler.
+    
+    Returns
+    -------
+    list
+        A dict (see `fetch_page`) or None for each url, in the same order as `urls`.
+        Every item is None if `aiohttp` is not installed.
+    
+    """
+    urls = list(urls)
+    if aiohttp is None or len(urls) == 0:
+        return [None] * len(urls)
+    
+    return asyncio.run(fetch_all(urls, per_host, limit, timeout, scheduler))
+
+## Define `FixtureHandler` to serve saved pages in place of the publishers
+class FixtureHandler(SimpleHTTPRequestHandler):
+    """Serve the files of a directory, answering the paths in `redirects` with a redirect."""
+    
+    redirects = {}  # {path: location}
+    
+    def do_GET(self):
+        """Redirect the request if its path is in `redirects`, otherwise serve the file."""
+        if self.path in self.redirects:
+            self.send_response(302)
+            self.send_header('Location', self.redirects[self.path])
+            self.end_headers()
+            return
+        
+        super().do_GET()
+    
+    def log_message(self, format, *args):
+        """Keep the requests out of the output."""
+
+@contextmanager
+def fixture_server(directory, port=0, redirects=None):
+    """
+    Serve a directory of saved pages over HTTP to stand in for publishers when testing.
+    
+    Parameters
+    ----------
+    directory : str
+        The directory of html files to serve.
+    port : int, optional
+        The port to serve on. The default is 0, which will pick a free port.
+    redirects : dict, optional
+        The paths to redirect and the location to redirect each to, i.e.
+        {'/articles/1': '/story.html'}. The default is None.
+    
+    Yields
+    ------
+    str
+        The base url of the server, i.e. 'http://127.0.0.1:50123'.
+    
+    """
+    handler = type('Handler', (FixtureHandler,), dict(redirects=dict(redirects or {})))
+    server  = ThreadingHTTPServer(('127.0.0.1', port), partial(handler, directory=directory))
+    thread  = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f'http://127.0.0.1:{server.server_address[1]}'
+    finally:
+        server.shutdown()
+        server.server_close()
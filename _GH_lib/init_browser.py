@@ -1,112 +1,308 @@
-# -*- coding: utf-8 -*-
-"""
-Created on Tue Aug 23 21:17:35 2022.
-
-Initialize the selenium browser object that will be used to scrape news articles.
-
-@author: grega
-"""
-import os
-import time
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException, ElementNotInteractableException
-
-def init_browser():
-    """
-    Initialize a selenium webdriver and log in to a variety of news sources that have paywalls.
-    
-    Currently, the following news outlets will be logged in to:
-        - The Wall Street Journal
-        - The New York Times
-        - Bloomberg
-        - Seeking Alpha
-    
-    Returns
-    -------
-    driver : selenium.webdriver
-        A selenium webdriver object that has logged into a variety of news sources.
-
-    """
-    ## Initiate `Firefox` browser to be used in my_weekly_article module.
-    fp = webdriver.FirefoxProfile()
-    
-    ## Open the browser and go to the desired news page to scrape.
-    driver = webdriver.Firefox(firefox_profile=fp)
-    driver.maximize_window()
-    
-    ## Log in to WSJ
-    wsj_login = os.environ.get('WSJ_Login').split('|')
-    username = wsj_login[0]
-    password = wsj_login[1]
-    print(f'Username: {username}\nPassword: {password}')
-    driver.get("https://www.wsj.com/login")
-    
-    try:
-        driver.find_element_by_id('username').send_keys(username)
-        driver.find_element_by_id('password').send_keys(password)
-        driver.find_element(By.XPATH, '//button').click()
-    except (NoSuchElementException, ElementNotInteractableException):
-        print('Need to manually enter login info')
-        
-    input('Logged in to WSJ?')
-    
-    ## Log in to NYT
-    nyt_login = os.environ.get('NYT_Login').split('|')
-    username = nyt_login[0]
-    password = nyt_login[1]
-    print(f'Username: {username}\nPassword: {password}')
-    
-    try:
-        driver.get("https://www.nytimes.com/login")
-        time.sleep(1)
-        driver.find_element_by_id('username').send_keys(username)
-    except (NoSuchElementException, ElementNotInteractableException):
-        try:
-            driver.find_element_by_id('email').send_keys(username)
-            driver.find_element(By.XPATH, '//button[text()="Continue"]').click()
-        except (NoSuchElementException, ElementNotInteractableException):
-            print('Need to manually enter login info')
-        
-    try:
-        driver.find_element_by_id('password').send_keys(password)
-        driver.find_element(By.XPATH, '//button').click()
-    except (NoSuchElementException, ElementNotInteractableException):
-        print('Need to manually enter login info')
-    
-    input('Logged in to NYT?')
-    
-    ## Log in to Bloomberg
-    bloom_login = os.environ.get('Bloomberg_Login').split('|')
-    username = bloom_login[0]
-    password = bloom_login[1]
-    print(f'Username: {username}\nPassword: {password}')
-    driver.get("https://www.bloomberg.com/account/signin")
-    time.sleep(1)
-    try:
-        driver.find_element_by_name('').send_keys(username)
-        driver.find_element_by_name('password').send_keys(password)
-        driver.find_element(By.XPATH, '//button[text()="Sign in"]').click()
-    except (NoSuchElementException, ElementNotInteractableException):
-        print('Need to manually log in!!!')
-    input('Logged in to Bloomberg?')
-    
-    # Log in to Seeking Alpha
-    seek_login = os.environ.get('SeekingAlpha_Login').split('|')
-    username = seek_login[0]
-    password = seek_login[1]
-    print(f'Username: {username}\nPassword: {password}')
-    
-    try:
-        driver.get("https://www.seekingalpha.com/login")
-        time.sleep(1)
-        driver.find_element_by_name('email').send_keys(username)
-        driver.find_element_by_name('password').send_keys(password)
-    except (NoSuchElementException, ElementNotInteractableException):
-        print('Need to manually log in!!!')
-    
-    input('Logged in to Seeking Alpha?')
-    
-    return driver
-
-# driver = init_browser()
+# -*- coding: utf-8 -*-
+"""
+Created on Tue Aug 23 21:17:35 2022.
+
+Initialize the selenium browser object that will be used to scrape news articles.
+
+The cookies of each publisher are saved to a session file after logging in, and restored into
+every new browser until they expire, so the publishers are only logged in to again when their
+session is missing or stale. Credentials are read from the `<Publisher>_Login` environment
+variables (formatted as `username|password`). A run with no terminal (i.e. a scheduled run)
+never waits for a login to be confirmed by hand.
+
+A login (or a saved session) only counts once the publisher's authentication cookie is set, so
+a login that failed or stopped at a captcha is never saved as a valid session.
+
+@author: grega
+"""
+import os
+import sys
+import json
+import time
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import NoSuchElementException, ElementNotInteractableException, \
+                                       WebDriverException, TimeoutException
+from rate_limit import wait_ready, wait_cookies
+
+SESSION_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'sessions')
+
+def login_wsj(driver, username, password):
+    """Log in to The Wall Street Journal."""
+    driver.get("https://www.wsj.com/login")
+    
+    try:
+        driver.find_element_by_id('username').send_keys(username)
+        driver.find_element_by_id('password').send_keys(password)
+        driver.find_element(By.XPATH, '//button').click()
+    except (NoSuchElementException, ElementNotInteractableException):
+        print('Need to manually enter login info')
+
+def login_nyt(driver, username, password):
+    """Log in to The New York Times."""
+    try:
+        driver.get("https://www.nytimes.com/login")
+        wait_ready(driver, tag='input')
+        driver.find_element_by_id('username').send_keys(username)
+    except (NoSuchElementException, ElementNotInteractableException):
+        try:
+            driver.find_element_by_id('email').send_keys(username)
+            driver.find_element(By.XPATH, '//button[text()="Continue"]').click()
+        except (NoSuchElementException, ElementNotInteractableException):
+            print('Need to manually enter login info')
+        
+    try:
+        driver.find_element_by_id('password').send_keys(password)
+        driver.find_element(By.XPATH, '//button').click()
+    except (NoSuchElementException, ElementNotInteractableException):
+        print('Need to manually enter login info')
+
+def login_bloomberg(driver, username, password):
+    """Log in to Bloomberg."""
+    driver.get("https://www.bloomberg.com/account/signin")
+    wait_ready(driver, tag='input')
+    try:
+        driver.find_element_by_name('').send_keys(username)
+        driver.find_element_by_name('password').send_keys(password)
+        driver.find_element(By.XPATH, '//button[text()="Sign in"]').click()
+    except (NoSuchElementException, ElementNotInteractableException):
+        print('Need to manually log in!!!')
+
+def login_seeking_alpha(driver, username, password):
+    """Log in to Seeking Alpha."""
+    try:
+        driver.get("https://www.seekingalpha.com/login")
+        wait_ready(driver, tag='input')
+        driver.find_element_by_name('email').send_keys(username)
+        driver.find_element_by_name('password').send_keys(password)
+        driver.find_element(By.XPATH, '//button[@type="submit"]').click()
+    except (NoSuchElementException, ElementNotInteractableException):
+        print('Need to manually log in!!!')
+
+# The publishers with paywalls, the environment variable of their credentials, the page their
+# cookies are restored on, how to log in to them, and the cookies that are only set once logged in
+LOGINS = dict(
+    wsj = dict(
+        name  = 'WSJ',
+        env   = 'WSJ_Login',
+        home  = 'https://www.wsj.com',
+        login = login_wsj,
+        auth  = ['djcs_session', 'djcs_auto'],
+    ),
+    nytimes = dict(
+        name  = 'NYT',
+        env   = 'NYT_Login',
+        home  = 'https://www.nytimes.com',
+        login = login_nyt,
+        auth  = ['NYT-S'],
+    ),
+    bloomberg = dict(
+        name  = 'Bloomberg',
+        env   = 'Bloomberg_Login',
+        home  = 'https://www.bloomberg.com',
+        login = login_bloomberg,
+        auth  = ['session_key'],
+    ),
+    seeking_alpha = dict(
+        name  = 'Seeking Alpha',
+        env   = 'SeekingAlpha_Login',
+        home  = 'https://www.seekingalpha.com',
+        login = login_seeking_alpha,
+        auth  = ['user_remember_token'],
+    ),
+)
+
+def logged_in(cookies, key):
+    """Check if a list of cookies has one of the authentication cookies of a publisher."""
+    return any(c.get('name') in LOGINS[key]['auth'] for c in cookies)
+
+def wait_login(driver, key, timeout=30):
+    """Wait until the driver has the authentication cookie of a publisher."""
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.5).until(
+            lambda driver: logged_in(driver.get_cookies(), key)
+        )
+    except (TimeoutException, WebDriverException):
+        return False
+    
+    return True
+
+def session_path(key, session_dir=SESSION_DIR):
+    """Return the path of the session file of a publisher."""
+    return os.path.join(session_dir, f'{key}.json')
+
+def save_session(driver, key, session_dir=SESSION_DIR):
+    """Save the cookies of the publisher the driver is logged in to."""
+    cookies = wait_cookies(driver)
+    if len(cookies) == 0:
+        return
+    
+    # Write to a temporary file first so a partial session is never read, and keep the
+    # sessions readable by this user only (even if the directory already existed)
+    os.makedirs(session_dir, mode=0o700, exist_ok=True)
+    os.chmod(session_dir, 0o700)
+    path = session_path(key, session_dir)
+    fd   = os.open(path + '.tmp', os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    os.chmod(path + '.tmp', 0o600)
+    with os.fdopen(fd, 'w') as f:
+        json.dump(dict(saved=time.time(), cookies=cookies), f)
+    os.replace(path + '.tmp', path)
+
+def read_session(key, session_dir=SESSION_DIR, max_age=7):
+    """
+    Read the saved cookies of a publisher, if they are still valid.
+    
+    Parameters
+    ----------
+    key : str
+        The publisher key in `LOGINS`.
+    session_dir : str, optional
+        The directory the session files are saved in. The default is `SESSION_DIR`.
+    max_age : float, optional
+        The number of days after which a session is logged in to again, even if its cookies
+        have not expired. The default is 7.
+    
+    Returns
+    -------
+    list or None
+        The unexpired cookies of the session. None if there is no session, it is older than
+        `max_age`, or its authentication cookie is missing or has expired.
+    
+    """
+    try:
+        with open(session_path(key, session_dir)) as f:
+            session = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    now = time.time()
+    if now - session.get('saved', 0) > max_age * 24 * 60 * 60:
+        return None
+    
+    cookies = [c for c in session.get('cookies', []) if c.get('expiry', now + 1) > now]
+    if not logged_in(cookies, key):
+        return None
+    
+    return cookies
+
+def restore_session(driver, key, cookies):
+    """
+    Add the saved cookies of a publisher to the driver and check the session is still valid.
+    
+    The home page is loaded again with the cookies, so a session the publisher has revoked
+    (and cleared the authentication cookie of) is not counted as logged in.
+    
+    Returns
+    -------
+    bool
+        True if the driver is still logged in to the publisher after reloading its home page.
+    
+    """
+    driver.get(LOGINS[key]['home'])
+    for cookie in cookies:
+        # Firefox rejects float expiry times
+        if 'expiry' in cookie:
+            cookie = dict(cookie, expiry=int(cookie['expiry']))
+        try:
+            driver.add_cookie(cookie)
+        except WebDriverException:
+            pass
+    
+    try:
+        driver.get(LOGINS[key]['home'])
+        wait_ready(driver)
+        return logged_in(driver.get_cookies(), key)
+    except WebDriverException:
+        return False
+
+def new_driver(headless=False):
+    """Open a new Firefox browser, optionally without a window."""
+    ## Initiate `Firefox` browser to be used in my_weekly_article module.
+    fp      = webdriver.FirefoxProfile()
+    options = webdriver.FirefoxOptions()
+    if headless:
+        options.add_argument('-headless')
+    
+    ## Open the browser and go to the desired news page to scrape.
+    driver = webdriver.Firefox(firefox_profile=fp, options=options)
+    if headless:
+        driver.set_window_size(1920, 1080)
+    else:
+        driver.maximize_window()
+    
+    return driver
+
+def init_browser(headless=None, interactive=None, session_dir=SESSION_DIR, max_age=7):
+    """
+    Initialize a selenium webdriver and log in to a variety of news sources that have paywalls.
+    
+    Currently, the following news outlets will be logged in to:
+        - The Wall Street Journal
+        - The New York Times
+        - Bloomberg
+        - Seeking Alpha
+    
+    Each publisher's saved session is restored if it is still valid (and the publisher still
+    accepts it once its home page is reloaded). Otherwise the publisher
+    is logged in to with the credentials in its environment variable (and skipped if there
+    are none), and the new session is saved once the login is confirmed.
+    
+    Parameters
+    ----------
+    headless : bool, optional
+        If True, the browser is opened without a window. The default is None, which is True if
+        the `Browser_Headless` environment variable is set to 1.
+    interactive : bool, optional
+        If True, wait for each login to be confirmed (i.e. to finish a captcha by hand) before
+        saving its session. The default is None, which is True if the run has a terminal.
+    session_dir : str, optional
+        The directory the session files are saved in. The default is `SESSION_DIR`.
+    max_age : float, optional
+        The number of days a saved session is used before logging in again. The default is 7.
+    
+    Returns
+    -------
+    driver : selenium.webdriver
+        A selenium webdriver object that has logged into a variety of news sources.
+    
+    """
+    if headless is None:
+        headless = os.environ.get('Browser_Headless', '0') == '1'
+    if interactive is None:
+        interactive = sys.stdin is not None and sys.stdin.isatty()
+    
+    driver = new_driver(headless)
+    
+    for key, site in LOGINS.items():
+        ## Restore the saved session of the publisher
+        cookies = read_session(key, session_dir, max_age)
+        if cookies is not None:
+            if restore_session(driver, key, cookies):
+                print(f"Restored {site['name']} session")
+                continue
+            print(f"The saved {site['name']} session is no longer valid, logging in again")
+        
+        ## Log in to the publisher
+        credentials = os.environ.get(site['env'])
+        if credentials is None or '|' not in credentials:
+            print(f"No {site['env']} credentials set, skipping {site['name']}")
+            continue
+        
+        username, password = credentials.split('|', 1)
+        print(f'Username: {username}')
+        site['login'](driver, username, password)
+        
+        if interactive:
+            input(f"Logged in to {site['name']}?")
+        
+        # Only save the session once the login is confirmed
+        if not wait_login(driver, key, timeout=5 if interactive else 30):
+            print(f"Could not confirm the {site['name']} login, its session was not saved")
+            continue
+        
+        save_session(driver, key, session_dir)
+    
+    return driver
+
+# driver = init_browser()
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 25 17:52:19 2026.
+
+Load the Loughran-McDonald (LM) sentiment word lists once per run.
+
+The word lists are downloaded the first time they are needed and saved to a local cache file,
+so later runs (and every topic within a run) read them from disk. The cache records where the
+lists came from, and they are downloaded again when that changes. Each category is held as a
+frozenset of upper case words so a token is checked in constant time.
+
+If the `LM_Dictionary` environment variable points to a copy of the LM Master Dictionary csv,
+every category is read from it. Otherwise the Negative and Positive lists are downloaded from
+GitHub and any other category is left empty.
+
+@author: grega
+"""
+import os
+import json
+import threading
+from functools import lru_cache
+
+import pandas as pd
+
+LM_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'lm_lexicon.json')
+LM_URL   = 'https://raw.githubusercontent.com/AmeriFinn/NLP-Projects/main/LoughranMcDonald_{}.csv'
+
+# The LM categories, and the column of each in the LM Master Dictionary
+LM_CATEGORIES = {
+    'Negative': 'Negative',
+    'Positive': 'Positive',
+    'Uncertainty': 'Uncertainty',
+    'Litigious': 'Litigious',
+    'StrongModal': 'Strong_Modal',
+    'WeakModal': 'Weak_Modal',
+    'Constraining': 'Constraining',
+}
+
+def lexicon_source():
+    """Describe where the LM word lists are read from, the Master Dictionary if one is set."""
+    master = os.environ.get('LM_Dictionary')
+    if master:
+        return dict(path=os.path.abspath(master), mtime=os.path.getmtime(master))
+    
+    return dict(url=LM_URL)
+
+def download_lexicon():
+    """Download the LM word lists, from the Master Dictionary if one is set."""
+    master = os.environ.get('LM_Dictionary')
+    if master:
+        df = pd.read_csv(master)
+        df = df.loc[df.Word.notna()]
+        # Words are flagged with the year they were added to a category (0 if not in it, and
+        # negative if they were removed from it)
+        return {
+            category: sorted(df.loc[df[col] > 0, 'Word'].astype(str).str.upper())
+            for category, col in LM_CATEGORIES.items() if col in df.columns
+        }
+    
+    return {
+        category: sorted(pd.read_csv(LM_URL.format(category), index_col=0).index.astype(str).str.upper())
+        for category in ['Negative', 'Positive']
+    }
+
+## Define `Lexicon` to hold the LM word lists
+class Lexicon:
+    """The LM word lists by category, held as frozensets of upper case words."""
+    
+    def __init__(self, words):
+        """
+        Initialize the lexicon.
+        
+        Parameters
+        ----------
+        words : dict
+            A list of words for each category, i.e. {'Negative': [...], 'Positive': [...]}.
+        
+        Returns
+        -------
+        None.
+        
+        """
+        self.categories = {
+            category: frozenset(w.upper() for w in words.get(category, []))
+            for category in LM_CATEGORIES
+        }
+    
+    def __getitem__(self, category):
+        """Return the words of a category."""
+        return self.categories[category]
+    
+    def score_document(self, document, category):
+        """Count the words of a tokenized `nlp_doc.Document` that are in a category."""
+        return document.count(self.categories[category])
+
+def read_lexicon(path=LM_CACHE):
+    """Read the LM word lists from the cache file, downloading and caching them if needed."""
+    source = lexicon_source()
+    try:
+        with open(path) as f:
+            cache = json.load(f)
+        # Only use the cache if it was downloaded from the same source
+        if cache.get('source') == source:
+            return Lexicon(cache['words'])
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+    
+    words = download_lexicon()
+    
+    # Write to a temporary file first so a partial cache is never read
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path + '.tmp', 'w') as f:
+        json.dump(dict(source=source, words=words), f)
+    os.replace(path + '.tmp', path)
+    
+    return Lexicon(words)
+
+lexicon_lock = threading.Lock()
+
+@lru_cache(maxsize=None)
+def cached_lexicon(path):
+    """Load the lexicon of a cache file once per process."""
+    return read_lexicon(path)
+
+def lm_lexicon(path=LM_CACHE):
+    """Return the shared LM `Lexicon`, loading it the first time it is needed."""
+    # Hold the lock so concurrent topics don't all download the word lists at once
+    with lexicon_lock:
+        return cached_lexicon(path)
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Fri Oct 30 19:24:08 2026.
+
+A tokenized document shared by every step of the NLP pipeline.
+
+An article (or a corpus of article summaries) is split into sentences and words once. Each
+word is mapped to an id in a shared `Vocabulary`, which also caches the lower case form and
+stem of each word, so the similarity matrix (`textrank`), near-duplicate checks (`dedup`),
+LM term counts (`lm_lexicon`), and sentiment scores all read the same tokens instead of
+parsing the text again. Selecting or combining the sentences of documents reuses their tokens.
+
+@author: grega
+"""
+import re
+import threading
+from functools import lru_cache
+
+import numpy as np
+from scipy import sparse
+from nltk import PorterStemmer
+
+@lru_cache(maxsize=None)
+def stop_words(language='english'):
+    """Load the nltk stop words of a language once, as a set for constant time lookups."""
+    from nltk.corpus import stopwords
+    return frozenset(stopwords.words(language))
+
+## Define `Vocabulary` to map each distinct word to an id
+class Vocabulary:
+    """A thread-safe map of lower case words to ids, with the stem of each word cached."""
+    
+    def __init__(self):
+        """
+        Initialize an empty vocabulary.
+        
+        Returns
+        -------
+        None.
+        
+        """
+        self.ids     = {}  # {lower case word: id}
+        self.words   = []  # The lower case word of each id
+        self.terms   = {}  # {id: word without punctuation}, filled in as terms are needed
+        self.stems   = {}  # {id: stem}, filled in as stems are needed
+        self.stemmer = PorterStemmer()
+        self.lock    = threading.Lock()
+    
+    def encode(self, words):
+        """Return the id of each word, adding any new words to the vocabulary."""
+        ids = []
+        with self.lock:
+            for word in words:
+                word = word.lower()
+                if word not in self.ids:
+                    self.ids[word] = len(self.words)
+                    self.words.append(word)
+                ids.append(self.ids[word])
+        
+        return ids
+    
+    def lookup(self, words):
+        """Return the ids of the words (in any case) that are in the vocabulary."""
+        ids = self.ids
+        return {ids[w.lower()] for w in words if w.lower() in ids}
+    
+    def term(self, i):
+        """Return the lower case word of a word id, without any punctuation."""
+        if i not in self.terms:
+            self.terms[i] = re.sub(r'[^a-z0-9&\-]+', '', self.words[i])
+        
+        return self.terms[i]
+    
+    def stem(self, i):
+        """Return the stem of a word id, without any punctuation."""
+        if i not in self.stems:
+            term = self.term(i)
+            self.stems[i] = self.stemmer.stem(term) if term != '' else ''
+        
+        return self.stems[i]
+    
+    def __len__(self):
+        """Return the number of distinct words."""
+        return len(self.ids)
+
+# The vocabulary shared by every document in the run
+vocabulary = Vocabulary()
+
+## Define `Document` to hold the tokens of a text
+class Document:
+    """The sentences of a text, with each word as its own item, and the id of each word."""
+    
+    def __init__(self, sentences, vocab=vocabulary, ids=None):
+        """
+        Tokenize a document that is already split into sentences and words.
+        
+        Parameters
+        ----------
+        sentences : list
+            A nested list of the sentences, with each word as it's own item.
+        vocab : Vocabulary, optional
+            The vocabulary to map the words to. The default is the shared `vocabulary`.
+        ids : list, optional
+            The word ids of each sentence, if they are already known. The default is None.
+        
+        Returns
+        -------
+        None.
+        
+        """
+        self.sentences = sentences
+        self.vocab     = vocab
+        self.ids       = [vocab.encode(s) for s in sentences] if ids is None else ids
+    
+    @classmethod
+    def from_text(cls, text, vocab=vocabulary):
+        """Split a block of text into sentences (each ending with a period) and words."""
+        sentences = [s.strip() for s in text.split(". ")]
+        sentences = [s + '.' if s[-1] != '.' else s for s in sentences if len(s) > 0]
+        
+        return cls([s.split(" ") for s in sentences], vocab)
+    
+    @classmethod
+    def concat(cls, documents, vocab=vocabulary):
+        """Combine the sentences of several documents, reusing their tokens."""
+        documents = [doc for doc in documents if doc is not None]
+        return cls(
+            [s for doc in documents for s in doc.sentences], vocab,
+            [ids for doc in documents for ids in doc.ids],
+        )
+    
+    def select(self, indices):
+        """Return a document of the sentences at `indices`, in that order."""
+        return Document(
+            [self.sentences[i] for i in indices], self.vocab, [self.ids[i] for i in indices]
+        )
+    
+    @property
+    def text(self):
+        """Join the sentences back together into a block of text."""
+        return ' '.join(' '.join(s) for s in self.sentences)
+    
+    def stems(self, i):
+        """Return the (cached) stems of the words of sentence `i`."""
+        return [self.vocab.stem(w) for w in self.ids[i]]
+    
+    def term_frequencies(self, stop_words=frozenset()):
+        """
+        Build the sparse sentence-by-word term frequency matrix of the document.
+        
+        Parameters
+        ----------
+        stop_words : set, optional
+            The words to ignore. The default is an empty set.
+        
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            The number of times each word id (column) is in each sentence (row).
+        
+        """
+        stop_ids   = self.vocab.lookup(stop_words)
+        rows, cols = [], []
+        for row, ids in enumerate(self.ids):
+            for i in ids:
+                if i not in stop_ids:
+                    rows.append(row)
+                    cols.append(i)
+        
+        # Duplicate (row, col) pairs are summed into counts
+        return sparse.csr_matrix(
+            (np.ones(len(rows)), (rows, cols)), shape=(len(self), len(self.vocab))
+        )
+    
+    def count(self, words):
+        """Count the words of the document, without punctuation, that are in `words`."""
+        words = {w.lower() for w in words}
+        return sum(self.vocab.term(i) in words for sentence in self.ids for i in sentence)
+    
+    def __len__(self):
+        """Return the number of sentences."""
+        return len(self.sentences)
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Tue Oct 20 21:26:33 2026.
+
+A content-addressed, on-disk cache of the pages scraped by `my_weekly_articles`.
+
+Each page is stored as a gzip compressed JSON file named by the hash of its normalized url,
+along with the resolved url, page title, domain, and the time it was fetched. Search pages
+and articles have separate time-to-live's, and the least recently used pages are evicted once
+the cache grows past its size limit. Re-running the report (or a backfill) will then skip the
+network and browser work for any page that has already been seen.
+
+@author: grega
+"""
+import os
+import gzip
+import json
+import time
+import hashlib
+import threading
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+PAGE_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'pages')
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = {'fbclid', 'gclid', 'guccounter', 'guce_referrer', 'guce_referrer_sig', 'ncid', 'cmpid'}
+
+def normalize_url(url):
+    """
+    Normalize a url so trivially different links to the same page share a cache entry.
+    
+    The scheme and host are lower cased, a leading `www.` and any trailing slash are dropped,
+    tracking parameters are removed, the remaining query parameters are sorted, and the
+    fragment is removed.
+    """
+    parts = urlsplit(url.strip())
+    host  = (parts.hostname or '').lower()
+    host  = host[4:] if host.startswith('www.') else host
+    if parts.port is not None and parts.port not in [80, 443]:
+        host = f'{host}:{parts.port}'
+    
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith('utm_')
+    )
+    
+    return urlunsplit(
+        ((parts.scheme or 'https').lower(), host, parts.path.rstrip('/') or '/', urlencode(query), '')
+    )
+
+## Define `PageCache` to store and look up scraped pages
+class PageCache:
+    """A size-bounded, on-disk cache of scraped pages keyed by normalized url."""
+    
+    def __init__(self, cache_dir=PAGE_CACHE, ttls=None, max_bytes=500 * 1024 ** 2):
+        """
+        Initialize the cache.
+        
+        Parameters
+        ----------
+        cache_dir : str, optional
+            The directory the pages are cached in. The default is `PAGE_CACHE`.
+        ttls : dict, optional
+            The number of seconds a page of each kind stays fresh. The default is None, which
+            will keep search pages for 15 minutes and articles for 7 days.
+        max_bytes : int, optional
+            The size limit of the cache. The default is 500MB.
+        
+        Returns
+        -------
+        None.
+        
+        """
+        self.cache_dir = cache_dir
+        self.ttls      = dict(search=15 * 60, article=7 * 24 * 60 * 60, **(ttls or {}))
+        self.max_bytes = max_bytes
+        self.size      = None
+        self.lock      = threading.Lock()
+    
+    def path(self, url):
+        """Determine the file path of the cache entry for a url."""
+        key = hashlib.sha256(normalize_url(url).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, key[:2], key + '.json.gz')
+    
+    def get(self, url, kind='article'):
+        """
+        Look up a page in the cache.
+        
+        Parameters
+        ----------
+        url : str
+            The url of the page.
+        kind : str, optional
+            The kind of page, which determines its time-to-live. The default is 'article'.
+        
+        Returns
+        -------
+        dict or None
+            The cached page source, resolved url, page title, domain, and fetch time.
+            None if the page is not cached or has expired.
+        
+        """
+        path = self.path(url)
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if time.time() - record['fetched'] > self.ttls[kind]:
+            return None
+        
+        # Touch the file so eviction is least recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        
+        return record
+    
+    def put(self, url, record, kind='article'):
+        """
+        Store a page in the cache under its url, and its resolved url if it was redirected.
+        
+        Parameters
+        ----------
+        url : str
+            The url the page was requested from.
+        record : dict
+            The page source (`page`), resolved url (`url`), page title (`title`) and domain
+            (`domain`) of the page.
+        kind : str, optional
+            The kind of page. The default is 'article'.
+        
+        Returns
+        -------
+        None.
+        
+        """
+        record = dict(record, fetched=time.time(), kind=kind)
+        data   = gzip.compress(json.dumps(record).encode('utf-8'))
+        
+        for key_url in {url, record.get('url') or url}:
+            path = self.path(key_url)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            
+            # Write to a temporary file first so readers never see a partial entry
+            tmp = f'{path}.{threading.get_ident()}.tmp'
+            with open(tmp, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, path)
+            
+            with self.lock:
+                if self.size is not None:
+                    self.size += len(data)
+        
+        self.evict()
+    
+    def evict(self):
+        """Delete the least recently used pages until the cache is back under its size limit."""
+        with self.lock:
+            if self.size is not None and self.size <= self.max_bytes:
+                return
+            
+            # Recount the cache since overwritten entries are double counted in `self.size`
+            entries   = self.entries()
+            self.size = sum(size for _, size, _ in entries)
+            if self.size <= self.max_bytes:
+                return
+            
+            # Evict down to 90% of the limit so eviction doesn't run on every write
+            for path, size, _ in sorted(entries, key=lambda entry: entry[2]):
+                if self.size <= 0.9 * self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                    self.size -= size
+                except OSError:
+                    pass
+    
+    def entries(self):
+        """List the path, size, and last access time of every cached page."""
+        entries = []
+        if not os.path.isdir(self.cache_dir):
+            return entries
+        
+        for folder in os.scandir(self.cache_dir):
+            if folder.is_dir():
+                for entry in os.scandir(folder.path):
+                    if entry.name.endswith('.json.gz'):
+                        stat = entry.stat()
+                        entries.append((entry.path, stat.st_size, stat.st_mtime))
+        
+        return entries
+
+# The cache shared by every scraper in the run
+page_cache = PageCache()
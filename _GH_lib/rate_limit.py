@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Wed Oct 21 20:07:45 2026.
+
+Pace the requests made to each publisher instead of sleeping a fixed amount after every page.
+
+Every domain gets its own token bucket, so a burst of requests to a fast site goes straight
+through while requests to the same site beyond the burst are spaced out at its rate. When a
+publisher errors or throttles a request (HTTP 429/503 or a browser error) the domain is put
+on an exponential backoff, which is relaxed again as requests succeed.
+
+Pages loaded with selenium are waited on until they are ready (the document has loaded or a
+paragraph is present) rather than for a fixed number of seconds.
+
+@author: grega
+"""
+import re
+import time
+import asyncio
+import threading
+from urllib.parse import urlsplit
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+
+# Google's hosts, i.e. news.google.com or consent.google.co.uk
+GOOGLE_HOST = re.compile(r'(?:^|\.)google\.[a-z.]+(?::\d+)?$', flags=re.IGNORECASE)
+
+def url_domain(url):
+    """Determine the domain of a url, i.e. 'https://www.cnbc.com/...' -> 'cnbc.com'."""
+    host = (urlsplit(url).hostname or '').lower()
+    return host[4:] if host.startswith('www.') else host
+
+## Define `DomainScheduler` to rate limit and back off requests per domain
+class DomainScheduler:
+    """A thread-safe set of per-domain token buckets with exponential backoff."""
+    
+    def __init__(self, rate=2.0, burst=4, rates=None, base_backoff=1.0, max_backoff=60.0):
+        """
+        Initialize the scheduler.
+        
+        Parameters
+        ----------
+        rate : float, optional
+            The number of requests per second allowed to a domain once its burst is used up.
+            The default is 2.0.
+        burst : int, optional
+            The number of requests that can be made to a domain back to back.
+            The default is 4.
+        rates : dict, optional
+            Domain specific `(rate, burst)` overrides, i.e. {'news.google.com': (0.5, 2)}.
+            The default is None.
+        base_backoff : float, optional
+            The number of seconds a domain is paused after its first error. Each further
+            error doubles the pause. The default is 1.0.
+        max_backoff : float, optional
+            The longest a domain will be paused, in seconds. The default is 60.0.
+        
+        Returns
+        -------
+        None.
+        
+        """
+        self.rate         = rate
+        self.burst        = burst
+        self.rates        = dict(rates or {})
+        self.base_backoff = base_backoff
+        self.max_backoff  = max_backoff
+        self.domains      = {}  # {domain: {'tat': float, 'backoff': float, 'until': float}}
+        self.lock         = threading.Lock()
+    
+    def state(self, domain):
+        """Return the bucket of a domain, creating it if needed. Must be called with the lock held."""
+        return self.domains.setdefault(domain, dict(tat=0.0, backoff=0.0, until=0.0))
+    
+    def reserve(self, url):
+        """
+        Reserve the next request slot for the domain of a url.
+        
+        The bucket is tracked by its theoretical arrival time, which is equivalent to a token
+        bucket refilled at `rate` that holds at most `burst` tokens.
+        
+        Parameters
+        ----------
+        url : str
+            The url about to be requested.
+        
+        Returns
+        -------
+        float
+            The number of seconds to wait before making the request.
+        
+        """
+        domain      = url_domain(url)
+        rate, burst = self.rates.get(domain, (self.rate, self.burst))
+        interval    = 1 / rate
+        
+        with self.lock:
+            now   = time.monotonic()
+            state = self.state(domain)
+            
+            # The earliest the request fits in the bucket, pushed back by any active backoff
+            start = max(now, state['tat'] - (burst - 1) * interval, state['until'])
+            state['tat'] = max(state['tat'], start) + interval
+        
+        return start - now
+    
+    def wait(self, url):
+        """Block the calling thread until a request to the domain of `url` is allowed."""
+        delay = self.reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+    
+    async def delay(self, url):
+        """Wait, without blocking the event loop, until a request to the domain of `url` is allowed."""
+        delay = self.reserve(url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+    
+    def penalize(self, url, retry_after=None):
+        """
+        Back off from the domain of a url after an error or a throttled request.
+        
+        Parameters
+        ----------
+        url : str
+            The url that failed.
+        retry_after : float, optional
+            The number of seconds the publisher asked to wait (the `Retry-After` header).
+            The default is None, which will double the current backoff.
+        
+        Returns
+        -------
+        float
+            The number of seconds the domain is paused for.
+        
+        """
+        with self.lock:
+            state = self.state(url_domain(url))
+            state['backoff'] = min(max(2 * state['backoff'], self.base_backoff), self.max_backoff)
+            pause = state['backoff'] if retry_after is None else min(float(retry_after), self.max_backoff)
+            state['until'] = max(state['until'], time.monotonic() + pause)
+        
+        return pause
+    
+    def reward(self, url):
+        """Relax the backoff of the domain of a url after a successful request."""
+        with self.lock:
+            state = self.state(url_domain(url))
+            state['backoff'] = state['backoff'] / 2 if state['backoff'] > self.base_backoff else 0.0
+
+## Define `wait_ready` to wait on a page load instead of sleeping
+def wait_ready(driver, timeout=10, tag='p'):
+    """
+    Wait until the current page of a webdriver has loaded or has a `tag` element on it.
+    
+    Parameters
+    ----------
+    driver : selenium.webdriver
+        The selenium webdriver object.
+    timeout : float, optional
+        The longest to wait, in seconds. The default is 10.
+    tag : str, optional
+        A tag whose presence means the content needed is on the page, even if other
+        resources are still loading. The default is 'p'.
+    
+    Returns
+    -------
+    bool
+        True if the page is ready, False if it timed out.
+    
+    """
+    def ready(driver):
+        return driver.execute_script(
+            "return document.readyState === 'complete' || "
+            "document.getElementsByTagName(arguments[0]).length > 0;",
+            tag,
+        )
+    
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(ready)
+        return True
+    except (TimeoutException, WebDriverException):
+        return False
+
+## Define `wait_redirect` to wait for a JavaScript redirect away from Google
+def wait_redirect(driver, timeout=10):
+    """
+    Wait until the current page of a webdriver has left Google's hosts.
+    
+    The `news.google.com/articles/...` links load an interstitial page that redirects to the
+    publisher with JavaScript, after `driver.get` has already returned.
+    
+    Parameters
+    ----------
+    driver : selenium.webdriver
+        The selenium webdriver object.
+    timeout : float, optional
+        The longest to wait, in seconds. The default is 10.
+    
+    Returns
+    -------
+    bool
+        True if the page is no longer on a Google host, False if it timed out.
+    
+    """
+    def left_google(driver):
+        return GOOGLE_HOST.search(urlsplit(driver.current_url).netloc) is None
+    
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(left_google)
+        return True
+    except (TimeoutException, WebDriverException):
+        return False
+
+def wait_cookies(driver, timeout=3):
+    """Wait until the current page of a webdriver has set cookies, and return them."""
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=0.1).until(lambda driver: driver.get_cookies())
+    except (TimeoutException, WebDriverException):
+        return []
+
+# The scheduler shared by every scraper in the run
+scheduler = DomainScheduler()
@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 20:12:41 2026.
+
+Profile the payload of the DataPane report as it is being built.
+
+For every page of the report the size of each figure/table once serialized, the number of
+traces, the number of data points, and the time taken to build it are recorded. The results
+can be written out as a JSON and HTML breakdown, and checked against a byte budget so a
+regression in the size of the report is caught before it is published.
+
+A figure built inside another profiled call (i.e. the article table of an equity page) is
+already part of the payload and build time of the figure it is built into, so it is recorded
+as nested and left out of the page totals.
+
+@author: grega
+"""
+import json
+import time
+import warnings
+import threading
+import numpy as np
+import pandas as pd
+
+class PayloadBudgetError(RuntimeError):
+    """Raised when the report payload exceeds the byte budget of a `ReportProfiler`."""
+
+## Define `ReportProfiler` to collect the payload statistics of the report
+class ReportProfiler:
+    """Record the serialized size, trace counts, point counts, and build times of report figures."""
+    
+    # Trace attributes that hold the data points of a figure
+    point_keys = ['x', 'y', 'z', 'open', 'high', 'low', 'close']
+    
+    def __init__(self, max_bytes=None, page_max_bytes=None, on_exceed='warn'):
+        """
+        Initialize the profiler.
+        
+        Parameters
+        ----------
+        max_bytes : int, optional
+            The byte budget of a single report. The default is None (no budget).
+        page_max_bytes : int, optional
+            The byte budget of a single page. The default is None (no budget).
+        on_exceed : str, optional
+            Either 'warn' to issue a warning or 'raise' to raise a `PayloadBudgetError` when a
+            budget is exceeded. The default is 'warn'.
+        
+        Returns
+        -------
+        None.
+        
+        """
+        if on_exceed not in ['warn', 'raise']:
+            raise ValueError(f"`on_exceed` must be 'warn' or 'raise', not {on_exceed!r}")
+        
+        self.max_bytes      = max_bytes
+        self.page_max_bytes = page_max_bytes
+        self.on_exceed      = on_exceed
+        self.records        = []
+        self.local          = threading.local()  # The depth of the profiled calls of each thread
+    
+    def call(self, page, label, func, *args, **kwargs):
+        """
+        Call `func`, time it, and record the payload of the figure(s) it returns.
+        
+        If `func` returns a tuple, each item is recorded as `label[i]` and the build time of
+        the call is attributed to the first item. A call made while another call is running
+        (on the same thread) is recorded as nested.
+        
+        Parameters
+        ----------
+        page : str
+            The page (ticker) the figure belongs to.
+        label : str
+            The name of the figure builder, i.e. `Equity_Plot`.
+        func : callable
+            The function that builds the figure(s).
+        
+        Returns
+        -------
+        The result of `func`.
+        
+        """
+        depth            = getattr(self.local, 'depth', 0)
+        self.local.depth = depth + 1
+        try:
+            start  = time.perf_counter()
+            result = func(*args, **kwargs)
+            secs   = time.perf_counter() - start
+        finally:
+            self.local.depth = depth
+        
+        if isinstance(result, tuple):
+            for i, obj in enumerate(result):
+                self.record(page, f'{label}[{i}]', obj, secs if i == 0 else 0.0, depth > 0)
+        else:
+            self.record(page, label, result, secs, depth > 0)
+        
+        return result
+    
+    def record(self, page, label, obj, secs=0.0, nested=False):
+        """
+        Record the payload statistics of a plotly figure, pd.DataFrame, or text block.
+        
+        Nested records (figures that are part of another recorded figure) are informational
+        and are not counted in the page totals or budgets.
+        
+        """
+        if hasattr(obj, 'to_plotly_json'):
+            payload = obj.to_json()
+            traces  = len(obj.data)
+            points  = sum(self.trace_points(trace) for trace in obj.data)
+        elif isinstance(obj, pd.DataFrame):
+            payload = obj.to_json()
+            traces  = 0
+            points  = obj.size
+        else:
+            payload = str(obj)
+            traces  = 0
+            points  = 0
+        
+        self.records.append(
+            dict(
+                Page       = page,
+                Figure     = label,
+                Bytes      = len(payload.encode('utf-8')),
+                Traces     = traces,
+                Points     = int(points),
+                Build_Secs = round(secs, 4),
+                Nested     = nested,
+            )
+        )
+    
+    def trace_points(self, trace):
+        """Count the data points held by a single plotly trace."""
+        points = 0
+        for key in self.point_keys:
+            values = trace[key] if key in trace else None
+            if values is not None:
+                points += np.size(np.asarray(values, dtype=object))
+        
+        # Tables store their data as a list of columns
+        if trace.type == 'table' and trace.cells.values is not None:
+            points += sum(len(col) for col in trace.cells.values)
+        
+        return points
+    
+    def pages(self):
+        """Summarize the recorded statistics by page, leaving out the nested records."""
+        df = pd.DataFrame(self.records, columns=['Page', 'Figure', 'Bytes', 'Traces', 'Points', 'Build_Secs', 'Nested'])
+        df = df.loc[~df.Nested.astype(bool)]
+        return df.groupby('Page', sort=False)[['Bytes', 'Traces', 'Points', 'Build_Secs']].sum()
+    
+    def check(self, pages=None):
+        """
+        Check the recorded payload against the byte budgets.
+        
+        Parameters
+        ----------
+        pages : list, optional
+            The pages that make up the report being checked. The default is None, which will
+            check every page that has been recorded.
+        
+        Returns
+        -------
+        list
+            A list of messages describing each budget that was exceeded.
+        
+        """
+        page_df = self.pages()
+        if pages is not None:
+            page_df = page_df.loc[page_df.index.isin(pages)]
+        
+        exceeded = []
+        if self.page_max_bytes is not None:
+            for page, size in page_df.Bytes.items():
+                if size > self.page_max_bytes:
+                    exceeded.append(
+                        f"Page {page} is {size:,} bytes (budget {self.page_max_bytes:,})"
+                    )
+        
+        if self.max_bytes is not None and page_df.Bytes.sum() > self.max_bytes:
+            exceeded.append(
+                f"Report is {page_df.Bytes.sum():,} bytes (budget {self.max_bytes:,})"
+            )
+        
+        for msg in exceeded:
+            if self.on_exceed == 'raise':
+                raise PayloadBudgetError(msg)
+            warnings.warn(msg)
+        
+        return exceeded
+    
+    def write(self, path='report_profile'):
+        """
+        Write the recorded statistics to `{path}.json` and `{path}.html`.
+        
+        Parameters
+        ----------
+        path : str, optional
+            The file path, without an extension, to write to. The default is 'report_profile'.
+        
+        Returns
+        -------
+        None.
+        
+        """
+        page_df = self.pages()
+        fig_df  = pd.DataFrame(self.records)
+        
+        with open(f'{path}.json', 'w') as f:
+            json.dump(
+                dict(
+                    total_bytes = int(page_df.Bytes.sum()),
+                    budget      = dict(max_bytes=self.max_bytes, page_max_bytes=self.page_max_bytes),
+                    pages       = json.loads(page_df.reset_index().to_json(orient='records')),
+                    figures     = self.records,
+                ),
+                f,
+                indent=2,
+            )
+        
+        with open(f'{path}.html', 'w') as f:
+            f.write('<h2>Report Payload by Page</h2>\n')
+            f.write(page_df.sort_values(by='Bytes', ascending=False).to_html())
+            f.write('\n<h2>Report Payload by Figure</h2>\n')
+            f.write(fig_df.sort_values(by='Bytes', ascending=False).to_html(index=False))
+
+def profiled(profiler, page, label, func, *args, **kwargs):
+    """Call `func` through `profiler` if one is provided, otherwise just call it."""
+    if profiler is None:
+        return func(*args, **kwargs)
+    return profiler.call(page, label, func, *args, **kwargs)
@@ -0,0 +1,317 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Thu Oct 22 19:36:10 2026.
+
+The html patterns used to scrape article indexes and article texts, compiled once per run.
+
+Two kinds of patterns are kept in a `PatternRegistry`:
+    - Sources: the sites searched to build an article index (`index_topic`), with patterns for
+      the article cards, titles, links, publishing dates, and publishers on the search page.
+    - Publishers: the sites articles are collected from (`summarize_articles`), with patterns
+      for the paragraphs of an article. Publishers are looked up by the domain of the article,
+      and any unknown domain uses the combined pattern of every publisher.
+
+Each source and publisher also has XPath selectors, used by `html_extract` to pull the same
+elements out of a parsed page in one pass. The regular expressions are only used when no
+html parser is available.
+
+Additional sources and publishers can be registered in code, or loaded from a JSON file set in
+the `Scrape_Patterns` environment variable, i.e.
+    {"publishers": {"cnbc": {"site_name": "CNBC", "domains": ["cnbc.com"],
+                             "paragraph_reg": "<p>.*?</p>", "paragraph_xpath": "//p"}}}
+
+@author: grega
+"""
+import os
+import re
+import json
+
+# The search page patterns of each source used to build an article index
+SOURCES = dict(
+    coindesk = dict(
+        source_site     = ['https://www.coindesk.com', '/category/markets'],
+        article_pattern = '<div class="card-text-block">.*?</div>|<div class="list-item-card post">.*?</div>',
+        title_pattern   = "<a title=.*? href=.+?>",
+        link_pattern    = 'href=".*?"',
+        date_pattern    = '<span class="card-date">.*?</span>|<time class="time">.*?</time>',
+        sub_pattern     = ['<a title="|"|href=".*?"|>', 'href=|"', '<.*?>'],
+        xpaths          = dict(
+            card  = '//div[@class="card-text-block" or @class="list-item-card post"]',
+            title = './/a[@title]/@title',
+            link  = './/a[@title]/@href',
+            date  = './/span[@class="card-date"] | .//time[@class="time"]',
+        ),
+    ),
+    bloomberg = dict(
+        source_site     = 'https://www.bloomberg.com',
+        article_pattern = '<div class="card-text-block">|<div class="list-item-card post">.*?</div>',
+        title_pattern   = "<a title=.*? href=.+?>",
+        date_pattern    = '<span class="card-date">.*?</span>|<time class="time">.*?</time>',
+        link_pattern    = 'href=".*?"',
+        sub_pattern     = ['', '', ''],
+        xpaths          = dict(
+            card  = '//div[@class="card-text-block" or @class="list-item-card post"]',
+            title = './/a[@title]/@title',
+            link  = './/a[@title]/@href',
+            date  = './/span[@class="card-date"] | .//time[@class="time"]',
+        ),
+    ),
+    google = dict(
+        source_site     = 'https://news.google.com/search?q=',
+        article_pattern = '<article class=".*?>.*?</article>|<div class="list-item-card post">.*?</div>',
+        title_pattern   = r'<h(\d){1,2} .*?><a href="./articles/.*?">.*?</h(\d){1,2}>|' + \
+                          r'<h(\d){1,2} .*?><a class=".*?" href="./articles/.*?">.*?</h(\d){1,2}>',
+        date_pattern    = 'datetime=".*?"',  # '<time class=".*?>.*?</time>'
+        link_pattern    = '<a class=".*?".*href=".*?" .*?></a>',
+        source_pattern  = '<a href="./publications/.*?" data-n-tid=".*?">.*?</a>|' + \
+                          '<a class=".*?" href="./publications/.*?" data-n-tid=".*?">.*?</a>|' + \
+                          '</svg><a class=".*?" data-n-tid=".*?">.*?</a>',
+        sub_pattern     = ['<.*?>', 'href="|"', 'datetime="|T.*?"|"', '<.*?>'],
+        xpaths          = dict(
+            card      = '//article',
+            title     = './/a[starts-with(@href, "./articles/") and normalize-space()]',
+            link      = './/a[starts-with(@href, "./articles/")]/@href',
+            date      = './/time/@datetime',
+            publisher = './/a[@data-n-tid and normalize-space()]',
+        ),
+    ),
+    seeking_alpha = dict(
+        source_site     = ['https://seekingalpha.com', '/search?list=all&q=', '&tab=headlines'],
+        article_pattern = '<article class=".*?>.*?</article>',
+        title_pattern   = '<a class=".*?" href="/(article|news)/.*?">.*?</a>',
+        date_pattern    = '<span class=".*?" data-test-id="post-list-date">.*?</span>',
+        link_pattern    = 'href=".*?"',
+        sub_pattern     = ['<.*?>', 'href=|"', '<.*?>'],
+        xpaths          = dict(
+            card  = '//article',
+            title = './/a[contains(@href, "/article/") or contains(@href, "/news/")]',
+            link  = './/a[contains(@href, "/article/") or contains(@href, "/news/")]/@href',
+            date  = './/span[@data-test-id="post-list-date"]',
+        ),
+    ),
+    wsj = dict(
+        source_site     = ['https://www.wsj.com', '/search?query=', '&mod=searchresults_viewallresults'],
+        article_pattern = '<article class=".*?>.*?</article>',
+        title_pattern   = '<a class="" href=".*?"><span class="WSJTheme--headlineText-.*?">.*?</span>',
+        date_pattern    = '<p class="WSJTheme--timestamp-.*?">.*?</p>',
+        link_pattern    = 'href=".*?"',
+        sub_pattern     = ['', '', ''],
+        xpaths          = dict(
+            card  = '//article',
+            title = './/span[starts-with(@class, "WSJTheme--headlineText")]',
+            link  = './/a[.//span[starts-with(@class, "WSJTheme--headlineText")]]/@href',
+            date  = './/p[starts-with(@class, "WSJTheme--timestamp")]',
+        ),
+    ),
+)
+
+# The article paragraph patterns of each publisher, and the domains they publish on
+PUBLISHERS = dict(
+    bloomberg = dict(
+        site_name       = 'Bloomberg',
+        domains         = ['bloomberg.com'],
+        paragraph_reg   = '<p>.*?</p>|<p class="paywall">.*?</p>|<h1 class=".*?">.*?</h1>|' + \
+                          '<li class="abstract-item.*?">.*?</li>',
+        paragraph_xpath = '//p | //h1[@class] | //li[starts-with(@class, "abstract-item")]',
+    ),
+    coindesk = dict(
+        site_name       = 'Coin Desk',
+        domains         = ['coindesk.com'],
+        paragraph_reg   = '<p>.*?</p>|<b>.*?</b>|<p class=".*?">.*?</p>|' + \
+                          '<p dir="ltr">.*?</p>|<h[1-3] class=".*?">.*?</h[1-3]>',
+        paragraph_xpath = '//p | //b | //h1[@class] | //h2[@class] | //h3[@class]',
+    ),
+    forbes = dict(
+        site_name       = 'Forbes',
+        domains         = ['forbes.com'],
+        paragraph_reg   = '<p>.*?</p>|<p class=".*?">.*?</p>',
+        paragraph_xpath = '//p',
+    ),
+    nytimes = dict(
+        site_name       = 'NYT',
+        domains         = ['nytimes.com'],
+        paragraph_reg   = '<p>.*?</p>|<p class=".*?">.*?</p>',
+        paragraph_xpath = '//p',
+    ),
+    reuters = dict(
+        site_name       = 'Reuters',
+        domains         = ['reuters.com'],
+        paragraph_reg   = '<p class=".*?" data-testid=".*?">.*?</p>|' + \
+                          '<p class=".*?" .*?>.*?</p>|<p>.*?</p>|',
+        paragraph_xpath = '//p',
+    ),
+    seekingalpha = dict(
+        site_name       = 'Seeking Alpha',
+        domains         = ['seekingalpha.com'],
+        # <li>.*?</li>|<li class=".*?">.*?</li>|
+        paragraph_reg   = '<p>.*?</p>|<h1 class=".*?" data-test-id="post-title">.*?</h1>|' + \
+                          '<p class=".*?">.*?</p>',
+        paragraph_xpath = '//p | //h1[@data-test-id="post-title"]',
+    ),
+    yahoo = dict(
+        site_name       = 'Yahoo Finance',
+        domains         = ['yahoo.com'],
+        # The article body is found first, then the paragraphs within it
+        paragraph_reg   = [
+            '<div class="caas-body">.*?</div>',
+            '<p>.*?</p>|<p class=".*?">.*?</p>'  # |<header class=".*?">.*?</header>
+        ],
+        paragraph_xpath = '//div[@class="caas-body"]//p',
+    ),
+    wsj = dict(
+        site_name       = 'WSJ',
+        domains         = ['wsj.com'],
+        paragraph_reg   = '<p>.*?</p>|<p class=".*?">.*?</p>|<p class=".*?" data-type="paragraph">.*?</p>',
+        paragraph_xpath = '//p',
+    ),
+)
+
+def publisher_domain(domain):
+    """Clean up a domain or url, i.e. '.www.wsj.com' or 'https://www.wsj.com/...' -> 'wsj.com'."""
+    domain = re.sub('^[a-z]+://', '', domain.strip().lower()).split('/')[0].lstrip('.')
+    return domain[4:] if domain.startswith('www.') else domain
+
+## Define `PatternRegistry` to hold the compiled patterns of every source and publisher
+class PatternRegistry:
+    """The compiled scraping patterns of the index sources and article publishers."""
+    
+    def __init__(self, sources=SOURCES, publishers=PUBLISHERS):
+        """
+        Initialize the registry and compile the patterns.
+        
+        Parameters
+        ----------
+        sources : dict, optional
+            The search page patterns of each index source. The default is `SOURCES`.
+        publishers : dict, optional
+            The paragraph patterns and domains of each publisher. The default is `PUBLISHERS`.
+        
+        Returns
+        -------
+        None.
+        
+        """
+        self.sources    = {}
+        self.publishers = {}
+        self.domains    = {}  # {domain: publisher key}
+        self.combined   = None
+        
+        for name, patterns in sources.items():
+            self.register_source(name, **patterns)
+        for key, patterns in publishers.items():
+            self.register_publisher(key, **patterns)
+    
+    def register_source(self, name, source_site, sub_pattern, xpaths=None, **patterns):
+        """
+        Compile and register the search page patterns of an index source.
+        
+        `xpaths` is an optional dict of the XPath selectors of the article cards on the page
+        (`card`), and the `title`, `link`, `date`, and `publisher` within each card.
+        """
+        compiled = {key: re.compile(pattern) for key, pattern in patterns.items()}
+        compiled['source_site'] = source_site
+        compiled['sub_pattern'] = [re.compile(pattern) for pattern in sub_pattern]
+        compiled['xpaths']      = xpaths
+        
+        self.sources[name.lower()] = compiled
+    
+    def register_publisher(self, key, paragraph_reg, site_name, domains=(), paragraph_xpath=None):
+        """
+        Compile and register the paragraph pattern of a publisher.
+        
+        Parameters
+        ----------
+        key : str
+            The name of the publisher, i.e. 'reuters'.
+        paragraph_reg : str or list
+            A regular expression of the paragraphs in an article. If a list of two expressions
+            is passed, the article body is found with the first and its paragraphs with the second.
+        site_name : str
+            The display name of the publisher.
+        domains : list, optional
+            The domains the publisher's articles are found on. The default is `key + '.com'`.
+        paragraph_xpath : str, optional
+            An XPath selector of the paragraphs in an article. The default is None, which will
+            only use `paragraph_reg`.
+        
+        Returns
+        -------
+        None.
+        
+        """
+        if isinstance(paragraph_reg, (list, tuple)):
+            compiled = tuple(re.compile(pattern) for pattern in paragraph_reg)
+        else:
+            compiled = re.compile(paragraph_reg)
+        
+        self.publishers[key] = dict(paragraph_reg=compiled, site_name=site_name, paragraph_xpath=paragraph_xpath)
+        for domain in (domains or [key + '.com']):
+            self.domains[publisher_domain(domain)] = key
+        
+        # The combined pattern has to be rebuilt to include this publisher
+        self.combined = None
+    
+    def source(self, name):
+        """Return the compiled search page patterns of an index source."""
+        return self.sources[name.lower()]
+    
+    def others(self):
+        """Return the combined paragraph pattern used for publishers that aren't registered."""
+        if self.combined is None:
+            # Join every distinct paragraph pattern and selector of the registered publishers
+            regs, paths = [], []
+            for patterns in self.publishers.values():
+                par_reg = patterns['paragraph_reg']
+                par_reg = par_reg if not isinstance(par_reg, tuple) else par_reg[1]
+                for reg in par_reg.pattern.split('|'):
+                    if reg not in regs and reg != '': regs.append(reg)
+            
+                # Selectors scoped to a part of the page (i.e. an article body) are left out
+                for path in (patterns['paragraph_xpath'] or '').split(' | '):
+                    if path not in paths and path != '' and '//' not in path[1:]: paths.append(path)
+            
+            self.combined = dict(
+                paragraph_reg   = re.compile('|'.join(regs)),
+                site_name       = 'Unkown',
+                paragraph_xpath = ' | '.join(paths) or None,
+            )
+        
+        return self.combined
+    
+    def publisher_key(self, domain):
+        """Determine the publisher key of a domain or url, or 'others' if it isn't registered."""
+        if domain is None:
+            return 'others'
+        
+        # Check the domain and each of its parent domains, i.e. finance.yahoo.com and yahoo.com
+        labels = publisher_domain(domain).split('.')
+        for i in range(len(labels) - 1):
+            key = self.domains.get('.'.join(labels[i:]))
+            if key is not None:
+                return key
+        
+        return 'others'
+    
+    def publisher(self, domain):
+        """Return the compiled paragraph pattern and site name of the publisher of a domain."""
+        key = self.publisher_key(domain)
+        return self.others() if key == 'others' else self.publishers[key]
+    
+    def scraping_keys(self):
+        """Return the patterns of every publisher, including 'others', keyed by publisher."""
+        return dict(self.publishers, others=self.others())
+    
+    def load(self, path):
+        """Register the sources and publishers defined in a JSON config file."""
+        with open(path) as f:
+            config = json.load(f)
+        
+        for name, patterns in config.get('sources', {}).items():
+            self.register_source(name, **patterns)
+        for key, patterns in config.get('publishers', {}).items():
+            self.register_publisher(key, **patterns)
+
+## The registry shared by every scraper, extended by the config file if one is set
+registry = PatternRegistry()
+if os.environ.get('Scrape_Patterns'):
+    registry.load(os.environ['Scrape_Patterns'])
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 22:14:52 2026.
+
+A pool of independent selenium browser sessions shared by the article scraping workers.
+
+A selenium webdriver can only be used by one thread at a time, so each worker checks a
+driver out of the pool for a single job (a Google News search or an article page) and returns
+it as soon as the job is done. This lets the indexing and article fetches for different
+topics and links run concurrently across however many browsers are in the pool.
+
+@author: grega
+"""
+import queue
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+## Define `DriverPool` to share a set of webdrivers across worker threads
+class DriverPool:
+    """A thread-safe pool of selenium webdrivers."""
+    
+    def __init__(self, drivers=None, factory=None, size=1):
+        """
+        Initialize the pool with existing drivers and/or drivers created by `factory`.
+        
+        Parameters
+        ----------
+        drivers : list, optional
+            A list of selenium webdrivers to add to the pool. The default is None.
+        factory : callable, optional
+            A function that returns a new webdriver, i.e. `init_browser`. It is called until the
+            pool has `size` drivers. The default is None.
+        size : int, optional
+            The number of drivers the pool should have. The default is 1.
+        
+        Returns
+        -------
+        None.
+        
+        """
+        self.drivers = list(drivers or [])
+        if factory is not None:
+            while len(self.drivers) < size:
+                self.drivers.append(factory())
+        
+        if len(self.drivers) == 0:
+            raise ValueError('A `DriverPool` needs at least one driver')
+        
+        self.idle = queue.Queue()
+        for driver in self.drivers:
+            self.idle.put(driver)
+    
+    def __len__(self):
+        """Return the number of drivers in the pool."""
+        return len(self.drivers)
+    
+    @contextmanager
+    def session(self):
+        """Check a driver out of the pool for the duration of a `with` block."""
+        driver = self.idle.get()
+        try:
+            yield driver
+        finally:
+            self.idle.put(driver)
+    
+    def map(self, func, items):
+        """
+        Call `func(driver, item)` for each item concurrently, one job per pooled driver.
+        
+        Parameters
+        ----------
+        func : callable
+            The job to run. It is passed a checked out driver and an item from `items`.
+        items : list
+            The items to process.
+        
+        Returns
+        -------
+        list
+            The results of each job, in the same order as `items`.
+        
+        """
+        def job(item):
+            with self.session() as driver:
+                return func(driver, item)
+        
+        with ThreadPoolExecutor(max_workers=len(self)) as executor:
+            return list(executor.map(job, items))
+    
+    def quit(self):
+        """Close every driver in the pool, releasing any attached to the browser service."""
+        for driver in self.drivers:
+            driver.quit()
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 31 17:41:55 2026.
+
+Score the polarity and subjectivity of the article summaries in batches, with a persistent memo.
+
+The scores of each text are stored in a sqlite database keyed by the hash of the backend and
+the text, so a summary that has already been scored (in an earlier run, or by another topic
+that shares the article) is read back instead of being scored again. Texts are looked up and
+stored once per batch.
+
+Three backends are available:
+    - textblob: the polarity and subjectivity of `TextBlob.sentiment`.
+    - vader: the compound score of nltk's VADER as the polarity, and the share of the text
+      that is positive or negative as the subjectivity.
+    - lm: the net share of Loughran-McDonald Positive terms in the LM terms as the polarity,
+      and the share of words that are LM terms as the subjectivity.
+
+Every backend reports both scores as percentages, i.e. a polarity between -100 and 100.
+
+@author: grega
+"""
+import os
+import sqlite3
+import hashlib
+import threading
+from contextlib import contextmanager
+
+from nlp_doc import Document
+from lm_lexicon import lm_lexicon
+
+SENTIMENT_CACHE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '.cache', 'sentiment.sqlite'
+)
+
+def textblob_scores(texts):
+    """Score texts with TextBlob."""
+    from textblob import TextBlob
+    
+    scores = []
+    for text in texts:
+        blob = TextBlob(text)
+        scores.append((blob.sentiment.polarity, blob.sentiment.subjectivity))
+    
+    return scores
+
+def vader_scores(texts):
+    """Score texts with nltk's VADER sentiment analyzer."""
+    from nltk.sentiment import SentimentIntensityAnalyzer
+    
+    sia    = SentimentIntensityAnalyzer()
+    scores = []
+    for text in texts:
+        vader = sia.polarity_scores(text)
+        scores.append((vader['compound'], vader['pos'] + vader['neg']))
+    
+    return scores
+
+def lm_scores(texts):
+    """Score texts with the Loughran-McDonald Positive and Negative word lists."""
+    lexicon = lm_lexicon()
+    
+    scores = []
+    for text in texts:
+        document = Document.from_text(text)
+        words    = sum(len(s) for s in document.sentences)
+        pos      = lexicon.score_document(document, 'Positive')
+        neg      = lexicon.score_document(document, 'Negative')
+        scores.append((
+            (pos - neg) / (pos + neg) if pos + neg > 0 else 0.0,
+            (pos + neg) / words if words > 0 else 0.0,
+        ))
+    
+    return scores
+
+BACKENDS = dict(textblob=textblob_scores, vader=vader_scores, lm=lm_scores)
+
+## Define `SentimentService` to score and memoize the sentiment of texts
+class SentimentService:
+    """Batch sentiment scoring with a selectable backend, memoized in a sqlite database."""
+    
+    def __init__(self, backend='textblob', path=SENTIMENT_CACHE):
+        """
+        Initialize the service.
+        
+        Parameters
+        ----------
+        backend : str, optional
+            The backend used to score texts, one of `BACKENDS`. The default is 'textblob'.
+        path : str, optional
+            The sqlite database the scores are stored in. If None, scores are only memoized
+            for the life of the service. The default is `SENTIMENT_CACHE`.
+        
+        Returns
+        -------
+        None.
+        
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown sentiment backend {backend}, use one of {list(BACKENDS)}")
+        
+        self.backend = backend
+        self.path    = path
+        self.memo    = {}  # {key: (polarity, subjectivity)}
+        self.lock    = threading.Lock()
+        
+        if path is not None:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with self.connect() as db:
+                db.execute(
+                    'CREATE TABLE IF NOT EXISTS sentiment '
+                    '(key TEXT PRIMARY KEY, polarity REAL, subjectivity REAL)'
+                )
+    
+    @contextmanager
+    def connect(self):
+        """Open a connection to the database, one per batch so it can be used from any thread."""
+        db = sqlite3.connect(self.path, timeout=30)
+        try:
+            # Commit the transaction if nothing went wrong
+            with db:
+                yield db
+        finally:
+            db.close()
+    
+    def key(self, text):
+        """Return the memo key of a text, the hash of the backend and the text."""
+        return hashlib.sha256(f'{self.backend}\0{text}'.encode('utf-8')).hexdigest()
+    
+    def lookup(self, keys):
+        """Read the stored scores of any keys that are in the database."""
+        found = {}
+        with self.connect() as db:
+            # Query in chunks to stay under the sqlite limit on query parameters
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                found.update(
+                    (key, (polarity, subjectivity)) for key, polarity, subjectivity in db.execute(
+                        'SELECT key, polarity, subjectivity FROM sentiment WHERE key IN '
+                        f'({",".join("?" * len(chunk))})', chunk
+                    )
+                )
+        
+        return found
+    
+    def score(self, texts):
+        """
+        Score a batch of texts, only running the backend on texts that were never scored.
+        
+        Parameters
+        ----------
+        texts : list
+            The texts to score.
+        
+        Returns
+        -------
+        list
+            The (polarity, subjectivity) of each text, as percentages rounded to 2 decimals.
+        
+        """
+        keys = [self.key(text) for text in texts]
+        
+        with self.lock:
+            missing = [key for key in dict.fromkeys(keys) if key not in self.memo]
+        if self.path is not None and len(missing) > 0:
+            stored = self.lookup(missing)
+            with self.lock:
+                self.memo.update(stored)
+            missing = [key for key in missing if key not in stored]
+        
+        if len(missing) > 0:
+            # Score each distinct text that has not been scored once
+            missing = set(missing)
+            todo    = {key: text for key, text in zip(keys, texts) if key in missing}
+            scored  = BACKENDS[self.backend](list(todo.values()))
+            scores  = {
+                key: (round(polarity * 100, 2), round(subjectivity * 100, 2))
+                for key, (polarity, subjectivity) in zip(todo, scored)
+            }
+            with self.lock:
+                self.memo.update(scores)
+            
+            if self.path is not None:
+                with self.connect() as db:
+                    db.executemany(
+                        'INSERT OR REPLACE INTO sentiment VALUES (?, ?, ?)',
+                        [(key, *score) for key, score in scores.items()],
+                    )
+        
+        with self.lock:
+            return [self.memo[key] for key in keys]
+
+sentiment_lock = threading.Lock()
+services       = {}
+
+def sentiment_service(backend='textblob', path=SENTIMENT_CACHE):
+    """Return the shared `SentimentService` of a backend, creating it the first time it's needed."""
+    with sentiment_lock:
+        if (backend, path) not in services:
+            services[backend, path] = SentimentService(backend, path)
+        
+        return services[backend, path]
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Thu Oct 29 18:52:31 2026.
+
+Normalize the paragraphs of an article in a single scan.
+
+Every html, boilerplate, and abbreviation rule is one named alternative of a single compiled
+pattern. Each paragraph is scanned once, and each match is replaced by the rule of the
+alternative that matched (`match.lastgroup`) from a dispatch table, instead of re-scanning the
+paragraph once per `re.sub`. Paragraphs are normalized lazily as they are found on the page,
+so a long page is never held as a list of raw and cleaned paragraphs at once.
+
+@author: grega
+"""
+import re
+import calendar
+
+# The boilerplate text of different publishers that is dropped from the articles
+BOILERPLATE = [
+    'Sign up for our newsletters',
+    'Please consider using a different web browser for better experience.',
+    'YOU MAY ALSO LIKE:.*', 'Tip:.*', 'Trending.*',
+    '.*looking.*join us.*', '.*current vacancies.*',
+    'You should be aware of.*',
+    'They may be used by those companies to build a profile of your.*',
+    'They may be set by us or by third party providers.*',
+    r'Want the latest recommendations from.*\?',
+    'Zacks’ free Fund Newsletter.*',
+    'Privacy Policy', 'Cookie Policy', 'Terms and Conditions', 'This website is operated.*',
+    'You should do your own.*?research before making any investment decisions.*',
+    'Advertisement', 'tap to bring up your browser menu.*', 'Ways to search.*',
+]
+
+# The rules, in the order they are tried at each position, and what each match is replaced by
+RULES = [
+    ('navi',    r'<span class="navi-bar.*?">.*?</span>',        ''),
+    ('block',   r'</li>|</h[1-9]>',                              '.'),
+    ('tag',     r'<.*?>',                                        ''),
+    ('boiler',  '|'.join(BOILERPLATE),                           ''),
+    ('sp',      r'\bS(?: |&amp;|&nbsp;)P\b',                     'S&P'),
+    ('entity',  r'&nbsp;|&amp;',                                 ' '),
+    ('quote',   r'"\.',                                          '",,'),
+    ('us',      r'U\.S\.(?:A\.)?',                               'US'),
+    ('number',  r'\bNo\.',                                       'Number'),
+    # Drop the period of titles and abbreviated months so they don't end a sentence
+    ('abbrev',  r'\b(?:Mrs|Mr|Ms|' + '|'.join(calendar.month_abbr[1:]) + r')\.',
+     lambda match: match.group(0)[:-1]),
+]
+
+NORMALIZE = re.compile('|'.join(f'(?P<{name}>{pattern})' for name, pattern, repl in RULES))
+REPLACE   = {name: repl for name, pattern, repl in RULES}
+
+def replace(match):
+    """Return the replacement of a match from the rule that matched it."""
+    repl = REPLACE[match.lastgroup]
+    return repl(match) if callable(repl) else repl
+
+def normalize_text(paragraph):
+    """Strip the html elements, boilerplate, and abbreviations from a paragraph of an article."""
+    # Collapse the whitespace left around the html elements that were removed
+    return ' '.join(NORMALIZE.sub(replace, paragraph).split())
+
+def normalize_paragraphs(paragraphs):
+    """Lazily normalize a stream of paragraphs, skipping any that are left empty."""
+    for paragraph in paragraphs:
+        paragraph = normalize_text(paragraph)
+        if paragraph != '':
+            yield paragraph
+
+def iterfind(pattern, text):
+    """Lazily yield the same strings as `pattern.findall(text)` for a pattern with up to one group."""
+    for match in pattern.finditer(text):
+        yield match.group(pattern.groups and 1)
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Tue Oct 27 19:36:12 2026.
+
+Rank the sentences of an article by their similarity to the other sentences (TextRank).
+
+The words of every sentence are ids in one shared vocabulary (see `nlp_doc`), so each document
+is a single sparse sentence-by-word term frequency matrix. Each row is scaled to unit length and
+every pairwise cosine similarity is then one sparse matrix product.
+
+The sentences are ranked with PageRank, by power iteration directly on the sparse row
+normalized similarity matrix.
+
+@author: grega
+"""
+import numpy as np
+from scipy import sparse
+
+## Define `similarity_matrix` to compare every sentence of a document at once
+def similarity_matrix(document, stop_words=frozenset()):
+    """
+    Calculate the cosine similarity of every pair of sentences in a document.
+    
+    Parameters
+    ----------
+    document : nlp_doc.Document
+        The tokenized document.
+    stop_words : set, optional
+        The words to ignore. The default is an empty set.
+    
+    Returns
+    -------
+    scipy.sparse.csr_matrix
+        The symmetric matrix of similarity scores between 0 and 1. A score of 0 means there
+        is no similarity and 1 means the sentences are the same. Sentences with no words
+        (other than stop words) have a score of 0 with every sentence.
+    
+    """
+    tf = document.term_frequencies(stop_words)
+    
+    # Scale each sentence vector to unit length so the dot products are the cosine similarities
+    norms = np.sqrt(np.asarray(tf.multiply(tf).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    unit  = sparse.diags(1 / norms) @ tf
+    
+    return sparse.csr_matrix(unit @ unit.T)
+
+## Define `pagerank` to rank the sentences of a similarity matrix
+def pagerank(matrix, damping=0.85, tol=1e-6, max_iter=100, start=None):
+    """
+    Rank the nodes (sentences) of a weighted graph with PageRank by power iteration.
+    
+    This gives the same scores as `networkx.pagerank` of the graph of the matrix, including
+    the self loops on the diagonal. Sentences with no similarity to any sentence link to
+    every sentence equally.
+    
+    Parameters
+    ----------
+    matrix : scipy.sparse matrix or np.array
+        The n by n matrix of edge weights, i.e. from `similarity_matrix`.
+    damping : float, optional
+        The probability of following an edge instead of jumping to a random node.
+        The default is 0.85.
+    tol : float, optional
+        The iteration stops once the scores change by less than `n * tol` in total.
+        The default is 1e-6.
+    max_iter : int, optional
+        The maximum number of iterations. If the scores have not converged by then, the
+        last scores are returned. The default is 100.
+    start : array-like, optional
+        Initial scores to warm start the iteration from, i.e. the scores of a previous
+        ranking of a similar document. The default is None, which starts from uniform scores.
+    
+    Returns
+    -------
+    np.array
+        The score of each node, summing to 1.
+    
+    """
+    n = matrix.shape[0]
+    if n == 0:
+        return np.zeros(0)
+    
+    # Row normalize the weights, then transpose so each iteration is one sparse product
+    matrix   = sparse.csr_matrix(matrix, dtype=float)
+    out      = np.asarray(matrix.sum(axis=1)).ravel()
+    dangling = out == 0
+    out[dangling] = 1
+    walk     = sparse.csr_matrix((sparse.diags(1 / out) @ matrix).T)
+    
+    x = np.full(n, 1 / n) if start is None else np.asarray(start, dtype=float)
+    x = x / x.sum() if len(x) == n and x.sum() > 0 else np.full(n, 1 / n)
+    for _ in range(max_iter):
+        prev = x
+        x    = damping * (walk @ x + x[dangling].sum() / n) + (1 - damping) / n
+        if np.abs(x - prev).sum() < n * tol:
+            break
+    
+    return x
@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 26 19:14:38 2026.
+
+Score the article titles of every topic in one batch.
+
+All titles (of every topic) are tokenized once into a sparse title-by-word matrix, and the
+Loughran-McDonald term counts are matrix products against a word vector for each LM category.
+Topic terms are matched with a `TopicMatcher` compiled once per topic, which finds every topic
+word, bigram, and trigram in a title in one pass. The date, publisher, and total relevancy
+scores are computed column-wise over the combined index.
+
+@author: grega
+"""
+import re
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from functools import lru_cache
+
+from mwr_utils import my_topic
+from lm_lexicon import lm_lexicon
+
+# Words, including tickers and abbreviations like S&P, U.S, or EUR-USD
+TOKEN = re.compile(r"[A-Za-z0-9]+(?:[&'.\-][A-Za-z0-9]+)*")
+
+# Possessives, which are dropped so i.e. "COMPANY'S" is counted as the LM word 'COMPANY'
+POSSESSIVE = re.compile(r"'s\b", flags=re.IGNORECASE)
+
+# Publishers with scraping patterns defined in `scrape_patterns`
+# TODO - Update the bloomber scraping procedures to make it an ideal publisher
+IDEAL_PUBLISHERS = [
+    'coindesk', 'forbes', 'reuters', 'seeking alpha', 'yahoo finance',
+    'the new york times', 'the wall street journal'
+]
+# Publishers with no scraping patterns defined but still good publishers
+PREFERRED_PUBLISHERS = [
+    'nasdaq', "barron's", 'marketwatch', 'cnbc', 'morningstar',
+    'cnn', 'fox business', 'zacks investment research', 'thestreet',
+    'financial times', 'investing.com', 'dailyfx'
+]
+
+def tokenize(text):
+    """Split text into upper case word tokens, without possessives."""
+    return [tok.upper() for tok in TOKEN.findall(POSSESSIVE.sub('', str(text)))]
+
+def ngrams(tokens, n=3):
+    """Return every 1 to `n` word n-gram of a list of tokens, joined by spaces."""
+    return [
+        ' '.join(tokens[i:i + k]) for k in range(1, n + 1) for i in range(len(tokens) - k + 1)
+    ]
+
+## Define `TopicMatcher` to find the terms of a topic in a title
+class TopicMatcher:
+    """The terms of a topic, compiled into a single pattern that is reused for every title."""
+    
+    def __init__(self, topic):
+        """
+        Collect the terms a title is checked for to score its relevance to a topic.
+    
+        These are the words of the topic's search term, plus each distinct bigram and trigram.
+        Words that repeat in the search term are counted once per repeat.
+    
+        Parameters
+        ----------
+        topic : str
+            The topic (ticker), i.e. '^GSPC'.
+        
+        Returns
+        -------
+        None.
+        
+        """
+        tokens = tokenize(my_topic(topic))
+        
+        self.topic   = topic
+        self.terms   = tokens + list(dict.fromkeys(gram for gram in ngrams(tokens) if ' ' in gram))
+        self.weights = {term: self.terms.count(term) for term in self.terms}
+        
+        # Match the longest words first so i.e. 'S&P' isn't cut short by 'S'
+        words = sorted(set(tokens), key=len, reverse=True)
+        self.pattern = re.compile(
+            r'(?<![A-Za-z0-9])(?:' + '|'.join(map(re.escape, words)) + r')(?![A-Za-z0-9])',
+            flags=re.IGNORECASE,
+        ) if len(words) > 0 else None
+    
+    def matches(self, title):
+        """Find the distinct topic terms in a title, in one pass over the title."""
+        if self.pattern is None:
+            return set()
+        
+        # Runs of topic words separated only by whitespace form the bigrams and trigrams
+        found, run, end = set(), [], None
+        for match in self.pattern.finditer(str(title)):
+            if end is None or str(title)[end:match.start()].strip() != '':
+                run = []
+            run = (run + [match.group(0).upper()])[-3:]
+            end = match.end()
+            found.update(' '.join(run[i:]) for i in range(len(run)))
+        
+        return found
+    
+    def score(self, title):
+        """Count the topic terms in a title, each once per time it is in the topic's terms."""
+        return sum(self.weights.get(term, 0) for term in self.matches(title))
+
+@lru_cache(maxsize=None)
+def topic_matcher(topic):
+    """Return the `TopicMatcher` of a topic, compiling it the first time it is needed."""
+    return TopicMatcher(topic)
+
+def term_matrix(titles):
+    """
+    Build the sparse title-by-word count matrix of a list of titles.
+    
+    Returns
+    -------
+    counts : scipy.sparse.csr_matrix
+        The number of times each word (column) is in each title (row).
+    vocab : dict
+        The column of each word.
+    
+    """
+    vocab, rows, cols = {}, [], []
+    for row, title in enumerate(titles):
+        for term in tokenize(title):
+            rows.append(row)
+            cols.append(vocab.setdefault(term, len(vocab)))
+    
+    # Duplicate (row, col) pairs are summed into counts
+    counts = sparse.csr_matrix(
+        (np.ones(len(rows)), (rows, cols)), shape=(len(titles), len(vocab))
+    )
+    
+    return counts, vocab
+
+def term_vector(vocab, terms):
+    """Build a vector over `vocab` with the number of times each term is in `terms`."""
+    vector = np.zeros(len(vocab))
+    for term in terms:
+        if term in vocab:
+            vector[vocab[term]] += 1
+    
+    return vector
+
+## Define `score_titles` to count the LM and topic terms of every title at once
+def score_titles(titles, topics, lexicon=None):
+    """
+    Count the Loughran-McDonald terms and topic terms of many titles in one batch.
+    
+    Parameters
+    ----------
+    titles : list-like
+        The titles to score.
+    topics : list-like or str
+        The topic (ticker) each title was found for, or a single topic for every title.
+    lexicon : lm_lexicon.Lexicon, optional
+        The LM lexicon. The default is None, which will use the shared lexicon.
+    
+    Returns
+    -------
+    pd.DataFrame
+        The `LMcD_Neg_Terms`, `LMcD_Pos_Terms`, `LMcD_Tot_Terms`, and `Title_Relevance`
+        of each title, in the same order (and with the same index) as `titles`.
+    
+    """
+    lexicon = lm_lexicon() if lexicon is None else lexicon
+    titles  = pd.Series(titles) if not isinstance(titles, pd.Series) else titles
+    topics  = [topics] * len(titles) if isinstance(topics, str) else list(topics)
+    
+    counts, vocab = term_matrix(titles)
+    
+    # LM terms are words of more than one character, counted every time they appear
+    words = [term for term in vocab if len(term) > 1]
+    neg   = counts @ term_vector(vocab, [w for w in words if w in lexicon['Negative']])
+    pos   = counts @ term_vector(vocab, [w for w in words if w in lexicon['Positive']])
+    
+    # Topic terms are counted once per title they appear in, with each topic's cached matcher
+    relevance = np.array(
+        [topic_matcher(topic).score(title) for title, topic in zip(titles, topics)], dtype=int
+    )
+    
+    return pd.DataFrame(
+        dict(
+            LMcD_Neg_Terms  = neg.astype(int),
+            LMcD_Pos_Terms  = pos.astype(int),
+            LMcD_Tot_Terms  = (neg + pos).astype(int),
+            Title_Relevance = relevance,
+        ),
+        index=titles.index,
+    )
+
+def date_relevance(dates, friday):
+    """Score the articles for their date relevance, 7 for this friday and less for older dates."""
+    days = np.array([(friday - date).days for date in dates])
+    return np.minimum(7 - days, 7)
+
+def publisher_scores(publishers):
+    """Score the article publishers so desired sources are more likely to be included."""
+    ## TODO
+    ## Continue tweaking this calculation - or even better, find an algorithmic solution...
+    publishers = pd.Series(publishers).str.lower()
+    return np.select(
+        [publishers.isin(IDEAL_PUBLISHERS), publishers.isin(PREFERRED_PUBLISHERS)], [50, 25], -25
+    )
+
+def date_weight(date_score):
+    """Calculate the weight of the Date Relevance for an array of date scores."""
+    ## TODO
+    ## Continue tweaking this calculation - or even better, find an algorithmic solution...
+    date_score = np.asarray(date_score, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.select(
+            [date_score > 0, date_score < 0],
+            [
+                # Scale score so articles this week have a more uniform chance of being displayed
+                np.round(5 * np.log(date_score), 6),
+                # Scale score so older articles have lower chance of being displayed
+                -np.round(3 * np.exp(np.abs(date_score) ** .5), 6),
+            ],
+            -0.5,
+        )
+
+def relevancy_scores(index_df):
+    """Calculate the total relevancy score from the LM, title, date, and publisher scores."""
+    ## TODO
+    ## Continue tweaking this calculation - or even better, find an algorithmic solution...
+    return (20 * index_df['LMcD_Tot_Terms']) + \
+           (20 * index_df['Title_Relevance']) + \
+           date_weight(index_df['Date_Relevance']) + \
+           (index_df['Publisher_Score'])
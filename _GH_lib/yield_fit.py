@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 21:03:18 2026.
+
+Fit smooth yield curves to the Treasury yields collected in `yield_plot.yield_curve`.
+
+Two methods are available:
+    - 'nss': A Nelson-Siegel-Svensson curve with fixed decay factors. With the decay factors
+      fixed the curve is linear in its four betas, so every date is fit at once with a single
+      least squares solve.
+    - 'pchip': A monotone piecewise cubic (PCHIP) spline through the published tenors.
+
+The fitted parameters are cached per date, so re-rendering the yield curve only fits dates
+that have not been seen before (or whose yields have been revised), and any grid of tenors can
+be evaluated in batch.
+
+@author: grega
+"""
+import re
+import numpy as np
+import pandas as pd
+from functools import lru_cache
+
+## Define `tenor_years` to convert the Treasury column names into years
+def tenor_years(label):
+    """Convert a Treasury tenor label, i.e. '3 Mo' or '10 Yr', into a number of years."""
+    match = re.search(r'([\d.]+)\s*(wk|week|mo|month|yr|year)', label.lower())
+    if match is None:
+        raise ValueError(f'Could not determine the tenor of {label!r}')
+    
+    units = {'wk': 1 / 52, 'week': 1 / 52, 'mo': 1 / 12, 'month': 1 / 12, 'yr': 1, 'year': 1}
+    return float(match.group(1)) * units[match.group(2)]
+
+## Define `nss_loadings` for the Nelson-Siegel-Svensson factor loadings
+def nss_loadings(tenors, lambdas=(0.7308, 0.2)):
+    """
+    Calculate the Nelson-Siegel-Svensson factor loadings for the given tenors.
+    
+    Parameters
+    ----------
+    tenors : array-like
+        The tenors, in years, to calculate the loadings for.
+    lambdas : tuple, optional
+        The two fixed decay factors. The default of 0.7308 is the Diebold-Li decay factor
+        converted to years, and 0.2 places the second hump further out the curve.
+    
+    Returns
+    -------
+    np.array
+        A (len(tenors), 4) array of loadings for the level, slope, and two curvature factors.
+    
+    """
+    t = np.asarray(tenors, dtype=float)
+    loadings = [np.ones_like(t)]
+    for i, lam in enumerate(lambdas):
+        slope = (1 - np.exp(-lam * t)) / (lam * t)
+        # The slope loading is only needed for the first decay factor
+        if i == 0:
+            loadings.append(slope)
+        loadings.append(slope - np.exp(-lam * t))
+    
+    return np.column_stack(loadings)
+
+## Define `YieldCurveModel` to fit and cache the yield curves for each date
+class YieldCurveModel:
+    """Fit yield curves for many dates at once and evaluate them on any grid of tenors."""
+    
+    def __init__(self, method='nss'):
+        """
+        Initialize the model.
+        
+        Parameters
+        ----------
+        method : str, optional
+            The curve fitting method, either 'nss' or 'pchip'. The default is 'nss'.
+        
+        Returns
+        -------
+        None.
+        
+        """
+        if method not in ['nss', 'pchip']:
+            raise ValueError(f"`method` must be 'nss' or 'pchip', not {method!r}")
+        
+        self.method = method
+        self.params = {}  # {date: (tenors, params)}
+        self.yields = {}  # {date: the tenors and yields the date was fit to}
+    
+    def fit(self, yield_df):
+        """
+        Fit the curves for every date in `yield_df` that has not already been fit to the same
+        yields.
+        
+        Dates are grouped by which tenors were published so each group is fit in one batch.
+        
+        Parameters
+        ----------
+        yield_df : pd.DataFrame
+            The yield curve data with a `Date` column followed by one column per tenor.
+        
+        Returns
+        -------
+        self
+        
+        """
+        # Only fit the dates that are new, or whose yields have been revised since they were fit
+        columns  = tuple(yield_df.columns[1:])
+        observed = [
+            (columns, row.tobytes()) for row in yield_df.iloc[:, 1:].to_numpy(dtype=float)
+        ]
+        changed  = np.array(
+            [self.yields.get(date) != obs for date, obs in zip(yield_df.Date, observed)], dtype=bool
+        )
+        new_df   = yield_df.loc[changed]
+        if new_df.empty:
+            return self
+        
+        for date, obs in zip(new_df.Date, [obs for obs, c in zip(observed, changed) if c]):
+            self.params.pop(date, None)
+            self.yields[date] = obs
+        
+        tenors = np.array([tenor_years(col) for col in new_df.columns[1:]])
+        yields = new_df.iloc[:, 1:].to_numpy(dtype=float)
+        
+        # Fit each group of dates that share the same published tenors together
+        masks, groups = np.unique(~np.isnan(yields), axis=0, return_inverse=True)
+        for g, mask in enumerate(masks):
+            rows = np.flatnonzero(groups.ravel() == g)
+            if mask.sum() < 4:
+                continue
+            
+            if self.method == 'nss':
+                betas = np.linalg.lstsq(nss_loadings(tenors[mask]), yields[rows][:, mask].T, rcond=None)[0]
+                fits  = betas.T
+            else:
+                fits  = yields[rows][:, mask]
+            
+            for date, fit in zip(new_df.Date.iloc[rows], fits):
+                self.params[date] = (tenors[mask], fit)
+        
+        return self
+    
+    def evaluate(self, grid, dates=None):
+        """
+        Evaluate the fitted curves on a grid of tenors.
+        
+        Parameters
+        ----------
+        grid : array-like
+            The tenors, in years, to evaluate.
+        dates : list-like, optional
+            The dates to evaluate. The default is None, which will evaluate every fitted date.
+            Dates that could not be fit are skipped.
+        
+        Returns
+        -------
+        pd.DataFrame
+            The fitted yields with one row per date and one column per tenor in `grid`.
+        
+        """
+        grid  = np.asarray(grid, dtype=float)
+        dates = sorted(self.params.keys()) if dates is None else [d for d in dates if d in self.params]
+        curve = np.full((len(dates), len(grid)), np.nan)
+        
+        if self.method == 'nss' and len(dates) > 0:
+            params = np.array([self.params[date][1] for date in dates])
+            curve  = params @ nss_loadings(grid).T
+        
+        else:
+            from scipy.interpolate import PchipInterpolator
+            
+            # Evaluate each group of dates that share the same knots in one batch
+            knots = {}
+            for i, date in enumerate(dates):
+                knots.setdefault(tuple(self.params[date][0]), []).append(i)
+            
+            for tenors, rows in knots.items():
+                values = np.array([self.params[dates[i]][1] for i in rows])
+                spline = PchipInterpolator(np.array(tenors), values.T, axis=0, extrapolate=False)
+                curve[rows, :] = spline(grid).T
+        
+        return pd.DataFrame(curve, index=pd.Index(dates, name='Date'), columns=grid)
+
+@lru_cache(maxsize=None)
+def curve_model(method='nss'):
+    """Return the shared `YieldCurveModel` for a method so fits are reused across renders."""
+    return YieldCurveModel(method)
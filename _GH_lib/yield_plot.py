@@ -1,323 +1,606 @@
-# -*- coding: utf-8 -*-
-"""
-Created on Thu Feb 10 18:54:31 2022
-
-@author: grega
-"""
-import pandas as pd
-import datetime as dt
-from mwr_utils import lst_unique, my_date_to_str
-from plotly.subplots import make_subplots
-import plotly.express as px
-import plotly.graph_objects as go
-import plotly.express as px
-from figure_frames import plotly_article_table
-
-## Define `yield_curve` function for collecting US Yield Curve data
-def yield_curve(friday):
-    """
-    Use to collect US Yield Curve data directly from US Treasury site.
-    
-    Parameters
-    ----------
-    friday : TYPE
-        DESCRIPTION.
-        
-    Returns
-    -------
-    df : TYPE
-        DESCRIPTION.
-        
-    """
-    # Collect data provided by the US treasury
-    y1_link = f"https://home.treasury.gov/resource-center/data-chart-center/interest-rates/TextView?type=daily_treasury_yield_curve&field_tdr_date_value={friday.year}"
-    y2_link = f"https://home.treasury.gov/resource-center/data-chart-center/interest-rates/TextView?type=daily_treasury_yield_curve&field_tdr_date_value={friday.year - 1}"
-    y3_link = f"https://home.treasury.gov/resource-center/data-chart-center/interest-rates/TextView?type=daily_treasury_yield_curve&field_tdr_date_value={friday.year - 2}"
-    y4_link = f"https://home.treasury.gov/resource-center/data-chart-center/interest-rates/TextView?type=daily_treasury_yield_curve&field_tdr_date_value={friday.year - 3}"
-
-    y1_df = pd.read_html(y1_link)[0]
-    y2_df = pd.read_html(y2_link)[0]
-    y3_df = pd.read_html(y3_link)[0]
-    y4_df = pd.read_html(y4_link)[0]
-    
-    # Drop unnecessary columns
-    for df in [y1_df, y2_df, y3_df, y4_df]:
-        df.drop(
-            [
-                '20 YR', '30 YR', 'Extrapolation Factor', '8 WEEKS BANK DISCOUNT',
-                'COUPON EQUIVALENT', '52 WEEKS BANK DISCOUNT', 'COUPON EQUIVALENT.1'
-            ],
-            axis = 1,
-            inplace = True
-        )
-    
-    # Concat the data frames
-    df = pd.concat([y1_df, y2_df, y3_df, y4_df], axis=0)
-    df.reset_index(inplace = True, drop = True)
-    
-    # Clean up the date column
-    df.Date = pd.to_datetime(df.Date, format="%m/%d/%Y")
-    df.sort_values(by='Date', ascending=True, inplace=True)
-    df.reset_index(inplace=True, drop=True)
-
-    # Create list of dates to collect
-    # my_dates = [friday] + [friday + dt.timedelta(days=-i) for i in [7, 7 * 2, 7 * 4, 7 * 8,
-    #                                                                 7 * 12, 7 * 24, 7 * 52,
-    #                                                                 7 * 76, 7 * 104]]
-    my_dates = [friday] + \
-        [friday + dt.timedelta(days=-i) for i in [j for j in range(7)]] + \
-            [friday + dt.timedelta(days=-i) for i in [7 * j for j in range(1, 158, 2)]]
-
-    # my_keys  = ['This Week', '1wk Ago', '2wk Ago', '1mo Ago', '2mo Ago', '3mo Ago', '6mo Ago', '1y Ago', '1.5y Ago', '2y Ago']
-    # my_keys  = [my_keys[-i] for i in range(1, len(my_keys) + 1)]
-    
-    # Clean the list of dates
-    i = 0
-    for dte in my_dates:
-        i += 1
-        while dte not in list(df.Date):
-            dte += dt.timedelta(days=-1)
-            my_dates[i - 1] = dte
-            
-    # Remove any duplicate dates
-    my_dates = lst_unique(my_dates)
-    
-    # Subset yield curve data for desired dates
-    df = df[df.Date.isin(my_dates)]
-    df.reset_index(inplace=True, drop=True)
-    
-    return df
-
-## Define `Yield_Plot` which will create the Yield Curve figure
-def Yield_Plot(yield_df, art_lst, friday):
-    """
-    Use to create an interactive visual of US Yield Curve data over past two years.
-
-    Parameters
-    ----------
-    yield_df : TYPE
-        DESCRIPTION.
-    art_lst : TYPE
-        DESCRIPTION.
-
-    Returns
-    -------
-    None.
-
-    """
-    CSdict  = {'type': 'surface', 'is_3d': True, 'colspan': 1, 'rowspan': 1}  # Candlestick plot specs
-    TBdict2  = {"type": "table", 'colspan': 1, 'rowspan': 1}                   # Table specs
-    
-    specs = [[CSdict],
-             [TBdict2]]
-    subtitles = ['<em>US Yield Curve', 'Relevant Articles']
-    
-    # Create the figure object
-    fig = make_subplots(
-        rows = 2,
-        cols = 1,
-        # column_widths = [1.1, 1.4, 1.1],
-        row_heights = [2, 1],
-        horizontal_spacing = 0.05,
-        vertical_spacing = 0.07,
-        specs = specs,
-        subplot_titles = subtitles,
-    )
-    
-    # Update the report title and other attributes
-    # report_dates = [my_date_to_str(friday + dt.timedelta(days=-7), [True, False]),
-    #                 my_date_to_str(friday, [True, False])]
-    # report_title = "Gral's Weekly Market Update"
-    # report_descr = ' to '.join(report_dates)
-    
-    fig.update_layout(
-        # title = f"<em>{report_title} | " + report_descr,
-        # title_font_size = 28,
-        template = 'seaborn',
-        height = 1000,
-        width = 1400,
-        autosize = True,
-        hovermode = 'x',
-    )
-
-    # Collect the appropiate colors for the box plots
-    colors = px.colors.diverging.curl
-    colors = colors[:4] + colors[-5:]
-    
-    # Add the 3D surface plot
-    x_dat = yield_df.columns[1:]
-    y_dat = yield_df.iloc[:, 0]
-    z_dat = yield_df.iloc[:, 1:]
-    
-    curve = go.Surface(x=x_dat,
-                       y=y_dat,
-                       z=z_dat,
-                       #name=y_dat,
-                       colorscale='RdBu',
-                       showscale=False,
-                       contours = {
-                           "x": {"show": True},  # "start": 1.5, "end": 2, "size": 0.04, "color":"white"},
-                           "y": {"show": True},
-                           "z": {"show": True}   # , "start": 0.5, "end": 1.8, "size": 0.05}
-                       }
-                       )
-
-    fig.add_trace(curve, row = 1, col = 1)
-    fig.update_traces(row = 1, col = 1,
-                      contours_z = dict(show=True, usecolormap=True,
-                                        highlightcolor="limegreen", project_z=True)
-                      )
-    fig.update_layout(
-                      scene = {"xaxis": {"title": "Tenor", "nticks": 20},
-                               "yaxis": {"title": "Closing Date"},
-                               "zaxis": {"title": "Closing Yield", "nticks": 10},
-#                               'camera_eye': {"x": 1, "y": 1, "z": 1},
-                               "aspectratio": {"x": 0.8, "y": 1, "z": 0.5}}
-                     )
-    
-    # Add drowdowns
-    # button_layer_1_height = 1.12
-    # button_layer_2_height = 1.065
-    
-    fig.update_layout(
-        updatemenus=[
-            # Buttons for changing plot type
-            # dict(
-            #     type = "buttons",
-            #     direction = "left",
-            #     buttons=list([
-            #         dict(
-            #             args2=[{"type": ["surface", "table"]}],
-            #             args=[{"colspan": [2, 1]}],
-            #             label="3D Surface",
-            #             method="restyle"
-            #         ),
-            #         dict(
-            #             args2=[{"type": ["heatmap", "table"]}],
-            #             args=[{"colspan": [2, 1]}],
-            #             label="Heatmap",
-            #             method="restyle"
-            #         )
-            #     ]),
-            #     pad={"r": 5, "t": 5},
-            #     showactive=True,
-            #     x=0.1,
-            #     xanchor="left",
-            #     y=-0.2,
-            #     yanchor="bottom"
-            # ),
-            ## Buttons for changing color scale
-            dict(
-                buttons=list([
-                    dict(
-                        args=[{"colorscale": ["RdBu", None]}],
-                        label="Red-Blue",
-                        method="restyle"
-                    ),
-                    dict(
-                        args=[{"colorscale": ["Cividis", None]}],
-                        label="Cividis",
-                        method="restyle"
-                    ),
-                    dict(
-                        args=[{"colorscale": ["Viridis", None]}],
-                        label="Viridis",
-                        method="restyle"
-                    ),
-                    dict(
-                        args=[{"colorscale": ["Greens", None]}],
-                        label="Greens",
-                        method="restyle"
-                    ),
-                ]),
-                type = "buttons",
-                direction="right",
-                pad={"r": 5, "t": 5},
-                showactive=True,
-                x=0.1,
-                xanchor="left",
-                y=-0.125,
-                yanchor="bottom"
-            ),
-            ## Button for reversing color scale
-            dict(
-                buttons=list([
-                    dict(
-                        args=[{"reversescale": [False, None]}],
-                        label="False",
-                        method="restyle"
-                    ),
-                    dict(
-                        args=[{"reversescale": [True, None]}],
-                        label="True",
-                        method="restyle"
-                    )
-                ]),
-                type = "buttons",
-                direction="right",
-                pad={"r": 5, "t": 5},
-                showactive=True,
-                x=0.4,
-                xanchor="left",
-                y=-0.125,
-                yanchor="bottom"
-            ),
-        ]
-    )
-    # Add annotations for buttons
-    fig.update_layout(
-        annotations=[
-            # dict(
-            #     text="Trace Type", x=0.05, xref="x domain", y=-0.2,
-            #     yref="y domain", align="left", showarrow=False
-            # ),
-            dict(
-                text='<em>Yield Curve', x=0.3, y=1,
-                xref="paper", yref="paper", showarrow=False
-            ),
-            dict(
-                text='Relevant Articles', x=0.9, y=1,
-                xref="paper", yref="paper", showarrow=False
-            ),
-            dict(
-                text="Color<br>Scale", x=0.05, xref="x domain",
-                y=-0.125, yref="y domain", showarrow=False
-            ),
-            dict(
-                text="Reverse<br>Colorscale", x=0.37, xref="x domain",
-                y=-0.125, yref="y domain", showarrow=False
-            ),
-        ]
-    )
-    
-    # Collect the articles table
-    articles = plotly_article_table('YIELD', art_lst)
-            
-    ## Add the articles table
-    # Create a list of fill colors for the table cells
-    cell_fill_color = ['whitesmoke'] * 3
-    head_fill_color = ['palegoldenrod'] * 3
-
-    # Create the table object to be added to the figure
-    table = go.Table(
-        header = dict(
-            values     = list(articles.columns),
-            font       = dict(size=14, color='black'),
-            line_color = None,
-            fill_color = head_fill_color,
-            align      = 'left'
-        ),
-        cells  = dict(
-            values     = [articles[col] for col in articles.columns],
-            font       = dict(size=12, color='black'),
-            line_color = None,
-            fill_color = cell_fill_color,
-            align      = 'left',
-            height     = 25
-        ),
-        columnwidth = [1, 1, 1.6],
-    )
-    
-    fig.add_trace(table, row = 2, col = 1)
-    
-    return fig
+# -*- coding: utf-8 -*-
+"""
+Created on Thu Feb 10 18:54:31 2022
+
+@author: grega
+"""
+import os
+import numpy as np
+import pandas as pd
+import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
+from mwr_utils import my_date_to_str
+from plotly.subplots import make_subplots
+import plotly.express as px
+import plotly.graph_objects as go
+import plotly.express as px
+from figure_frames import plotly_article_table
+from report_profiler import profiled
+from yield_fit import curve_model
+
+## Define the Treasury data sources and local cache location
+TREASURY_YEAR  = "https://home.treasury.gov/resource-center/data-chart-center/interest-rates/TextView?type=daily_treasury_yield_curve&field_tdr_date_value={year}"
+TREASURY_MONTH = "https://home.treasury.gov/resource-center/data-chart-center/interest-rates/TextView?type=daily_treasury_yield_curve&field_tdr_date_value_month={year}{month:02d}"
+YIELD_CACHE    = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'treasury')
+
+## Define `read_treasury` function to read and clean a single Treasury yield table
+def read_treasury(link):
+    """Read a Treasury yield table from a url or local file and drop the unnecessary columns."""
+    if str(link).endswith('.csv'):
+        df = pd.read_csv(link)
+    else:
+        df = pd.read_html(link)[0]
+    
+    # Drop unnecessary columns (not every year publishes all of them)
+    df.drop(
+        [
+            '20 YR', '30 YR', 'Extrapolation Factor', '8 WEEKS BANK DISCOUNT',
+            'COUPON EQUIVALENT', '52 WEEKS BANK DISCOUNT', 'COUPON EQUIVALENT.1'
+        ],
+        axis = 1,
+        inplace = True,
+        errors = 'ignore'
+    )
+    
+    # Clean up the date column
+    df.Date = pd.to_datetime(df.Date, format="%m/%d/%Y")
+    
+    return df
+
+## Define `treasury_year` function for loading one calendar year of yields
+def treasury_year(year, friday, cache_dir=YIELD_CACHE, source=None):
+    """
+    Load one calendar year of US Treasury yields, reading from the local cache when possible.
+    
+    Completed years never change, so once cached after the year has ended they are never
+    downloaded again. The current year (or a prior year cached before it ended) is refreshed
+    incrementally by only downloading the months after the last cached date.
+    
+    Parameters
+    ----------
+    year : int
+        The calendar year to load.
+    friday : dt.date
+        The friday of the week being reported on.
+    cache_dir : str, optional
+        The directory the yearly parquet files are cached in. The default is `YIELD_CACHE`.
+    source : str, optional
+        A local directory of `{year}.html` or `{year}.csv` fixture files to read instead of the
+        Treasury site. Fixtures are never cached. The default is None.
+        
+    Returns
+    -------
+    df : pd.DataFrame
+        The yields for the given year.
+        
+    """
+    # Read from the local fixtures if provided
+    if source is not None:
+        link = os.path.join(source, f'{year}.csv')
+        return read_treasury(link if os.path.exists(link) else os.path.join(source, f'{year}.html'))
+    
+    path = os.path.join(cache_dir, f'{year}.parquet')
+    
+    if not os.path.exists(path):
+        df = read_treasury(TREASURY_YEAR.format(year=year))
+        
+    else:
+        df = pd.read_parquet(path)
+        
+        # A prior year is complete once it has been cached after the year ended, and the
+        # current year may already be up to date
+        last = df.Date.max().date()
+        if year < dt.date.today().year:
+            end = dt.date(year, 12, 31)
+            if dt.date.fromtimestamp(os.path.getmtime(path)) > end:
+                return df
+        else:
+            end = min(friday, dt.date.today())
+            if last >= end:
+                return df
+        
+        # Only collect the months that have been published since the last cached date
+        new_df = []
+        for m in pd.period_range(pd.Timestamp(last), pd.Timestamp(end), freq='M'):
+            try:
+                new_df.append(read_treasury(TREASURY_MONTH.format(year=m.year, month=m.month)))
+            except ValueError:
+                # Nothing has been published for the month yet
+                continue
+        df = pd.concat([df] + new_df, axis=0)
+        df.drop_duplicates(subset='Date', keep='last', inplace=True)
+        
+    # Write the cache to a temporary file first so a crash can't leave a partial file behind
+    os.makedirs(cache_dir, exist_ok=True)
+    df.reset_index(inplace=True, drop=True)
+    df.to_parquet(path + '.tmp', index=False)
+    os.replace(path + '.tmp', path)
+    
+    return df
+
+## Define `yield_curve` function for collecting US Yield Curve data
+def yield_curve(friday, years=4, cache_dir=YIELD_CACHE, source=None, dates=None):
+    """
+    Use to collect US Yield Curve data directly from US Treasury site.
+    
+    Each calendar year is loaded concurrently through `treasury_year`, so after the first run
+    only the current year needs to touch the network.
+    
+    Parameters
+    ----------
+    friday : dt.date
+        The friday of the week being reported on.
+    years : int, optional
+        The number of calendar years of yields to collect. The default is 4.
+    cache_dir : str, optional
+        The directory the yearly parquet files are cached in. The default is `YIELD_CACHE`.
+    source : str, optional
+        A local directory of fixture files to read instead of the Treasury site.
+        The default is None.
+    dates : list-like, optional
+        The schedule of dates to sample the yield curve on. The default is None, which will use
+        the schedule from `sample_dates`.
+        
+    Returns
+    -------
+    df : pd.DataFrame
+        The yield curve data for the sampled dates.
+        
+    """
+    # Collect each year of data provided by the US treasury
+    with ThreadPoolExecutor(max_workers=years) as pool:
+        year_dfs = list(pool.map(
+            lambda year: treasury_year(year, friday, cache_dir, source),
+            range(friday.year, friday.year - years, -1)
+        ))
+    
+    # Concat the data frames
+    df = pd.concat(year_dfs, axis=0)
+    df.sort_values(by='Date', ascending=True, inplace=True)
+    df.reset_index(inplace=True, drop=True)
+
+    # Snap the sampling schedule to the available trading dates
+    df = snap_dates(df, sample_dates(friday) if dates is None else dates)
+    
+    return df
+
+## Define `sample_dates` to create the default sampling schedule for the yield curve surface
+def sample_dates(friday, daily=7, weekly_step=2, weeks=158):
+    """
+    Create the schedule of dates to sample the yield curve on.
+    
+    The default schedule is every day of the past week, then every other week for three years.
+    Any other schedule can be passed directly to `yield_curve`, i.e. weekly for 3 years with
+    `pd.date_range(end=friday, periods=156, freq='W-FRI')`.
+    
+    Parameters
+    ----------
+    friday : dt.date
+        The friday of the week being reported on.
+    daily : int, optional
+        The number of days before `friday` to sample daily. The default is 7.
+    weekly_step : int, optional
+        The number of weeks between samples after the daily samples. The default is 2.
+    weeks : int, optional
+        The number of weeks to sample. The default is 158.
+        
+    Returns
+    -------
+    list
+        The list of dates to sample.
+        
+    """
+    return [friday + dt.timedelta(days=-i) for i in range(daily)] + \
+        [friday + dt.timedelta(days=-7 * j) for j in range(1, weeks, weekly_step)]
+
+## Define `lod_dates` to create a level-of-detail sampling schedule for the yield curve
+def lod_dates(friday, full_weeks=4, overview_step=2, weeks=158):
+    """
+    Create a sampling schedule with full resolution for recent weeks and a coarse overview.
+    
+    Every trading day of the latest `full_weeks` weeks is sampled, then one day every
+    `overview_step` weeks for the remainder of the `weeks` sampled.
+    """
+    return sample_dates(friday, daily=7 * full_weeks, weekly_step=overview_step, weeks=weeks)
+
+## Define `snap_dates` to select the yield curve rows for a sampling schedule
+def snap_dates(df, dates):
+    """
+    Select the rows of `df` for the last trading date on or before each of the given dates.
+    
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The yield curve data, sorted by the `Date` column.
+    dates : list-like
+        The dates to sample.
+        
+    Returns
+    -------
+    pd.DataFrame
+        The unique rows of `df` that were sampled, in date order.
+        
+    """
+    targets = pd.to_datetime(pd.Series(list(dates))).values.astype(df.Date.values.dtype)
+    
+    # Find the position of the last available date at or before each target date
+    rows = np.searchsorted(df.Date.values, targets, side='right') - 1
+    rows = np.unique(rows[rows >= 0])
+    
+    return df.iloc[rows].reset_index(drop=True)
+
+## Define `Yield_Plot` which will create the Yield Curve figure
+def Yield_Plot(yield_df, art_lst, friday, profiler=None, method='nss', tenor_grid=None,
+               view='surface'):
+    """
+    Use to create an interactive visual of US Yield Curve data over past two years.
+
+    Parameters
+    ----------
+    yield_df : TYPE
+        DESCRIPTION.
+    art_lst : TYPE
+        DESCRIPTION.
+    profiler : ReportProfiler, optional
+        Records the payload of the articles table if provided. The default is None.
+    method : str, optional
+        The `yield_fit` method used to draw a smooth surface, either 'nss' or 'pchip'.
+        If None, the surface is drawn from the raw tenor columns. The default is 'nss'.
+    tenor_grid : array-like, optional
+        The tenors, in years, to evaluate the fitted curves on. The default is None, which will
+        use 60 evenly spaced tenors from one month to ten years.
+    view : str, optional
+        Either 'surface' for the 3D surface, or 'heatmap' for the lightweight figure created
+        by `Yield_Heatmap`. The default is 'surface'.
+
+    Returns
+    -------
+    None.
+
+    """
+    if view == 'heatmap':
+        return Yield_Heatmap(yield_df, art_lst, friday, profiler, method, tenor_grid)
+    
+    CSdict  = {'type': 'surface', 'is_3d': True, 'colspan': 1, 'rowspan': 1}  # Candlestick plot specs
+    TBdict2  = {"type": "table", 'colspan': 1, 'rowspan': 1}                   # Table specs
+    
+    specs = [[CSdict],
+             [TBdict2]]
+    subtitles = ['<em>US Yield Curve', 'Relevant Articles']
+    
+    # Create the figure object
+    fig = make_subplots(
+        rows = 2,
+        cols = 1,
+        # column_widths = [1.1, 1.4, 1.1],
+        row_heights = [2, 1],
+        horizontal_spacing = 0.05,
+        vertical_spacing = 0.07,
+        specs = specs,
+        subplot_titles = subtitles,
+    )
+    
+    # Update the report title and other attributes
+    # report_dates = [my_date_to_str(friday + dt.timedelta(days=-7), [True, False]),
+    #                 my_date_to_str(friday, [True, False])]
+    # report_title = "Gral's Weekly Market Update"
+    # report_descr = ' to '.join(report_dates)
+    
+    fig.update_layout(
+        # title = f"<em>{report_title} | " + report_descr,
+        # title_font_size = 28,
+        template = 'seaborn',
+        height = 1000,
+        width = 1400,
+        autosize = True,
+        hovermode = 'x',
+    )
+
+    # Collect the appropiate colors for the box plots
+    colors = px.colors.diverging.curl
+    colors = colors[:4] + colors[-5:]
+    
+    # Add the 3D surface plot
+    x_dat, y_dat, z_dat = surface_data(yield_df, method, tenor_grid)
+    
+    curve = go.Surface(x=x_dat,
+                       y=y_dat,
+                       z=z_dat,
+                       #name=y_dat,
+                       colorscale='RdBu',
+                       showscale=False,
+                       contours = {
+                           "x": {"show": True},  # "start": 1.5, "end": 2, "size": 0.04, "color":"white"},
+                           "y": {"show": True},
+                           "z": {"show": True}   # , "start": 0.5, "end": 1.8, "size": 0.05}
+                       }
+                       )
+
+    fig.add_trace(curve, row = 1, col = 1)
+    fig.update_traces(row = 1, col = 1,
+                      contours_z = dict(show=True, usecolormap=True,
+                                        highlightcolor="limegreen", project_z=True)
+                      )
+    fig.update_layout(
+                      scene = {"xaxis": {"title": "Tenor" if method is None else "Tenor (Years)", "nticks": 20},
+                               "yaxis": {"title": "Closing Date"},
+                               "zaxis": {"title": "Closing Yield", "nticks": 10},
+#                               'camera_eye': {"x": 1, "y": 1, "z": 1},
+                               "aspectratio": {"x": 0.8, "y": 1, "z": 0.5}}
+                     )
+    
+    # Add drowdowns
+    # button_layer_1_height = 1.12
+    # button_layer_2_height = 1.065
+    
+    fig.update_layout(
+        updatemenus=[
+            # Buttons for changing plot type
+            # dict(
+            #     type = "buttons",
+            #     direction = "left",
+            #     buttons=list([
+            #         dict(
+            #             args2=[{"type": ["surface", "table"]}],
+            #             args=[{"colspan": [2, 1]}],
+            #             label="3D Surface",
+            #             method="restyle"
+            #         ),
+            #         dict(
+            #             args2=[{"type": ["heatmap", "table"]}],
+            #             args=[{"colspan": [2, 1]}],
+            #             label="Heatmap",
+            #             method="restyle"
+            #         )
+            #     ]),
+            #     pad={"r": 5, "t": 5},
+            #     showactive=True,
+            #     x=0.1,
+            #     xanchor="left",
+            #     y=-0.2,
+            #     yanchor="bottom"
+            # ),
+            ## Buttons for changing color scale
+            dict(
+                buttons=list([
+                    dict(
+                        args=[{"colorscale": ["RdBu", None]}],
+                        label="Red-Blue",
+                        method="restyle"
+                    ),
+                    dict(
+                        args=[{"colorscale": ["Cividis", None]}],
+                        label="Cividis",
+                        method="restyle"
+                    ),
+                    dict(
+                        args=[{"colorscale": ["Viridis", None]}],
+                        label="Viridis",
+                        method="restyle"
+                    ),
+                    dict(
+                        args=[{"colorscale": ["Greens", None]}],
+                        label="Greens",
+                        method="restyle"
+                    ),
+                ]),
+                type = "buttons",
+                direction="right",
+                pad={"r": 5, "t": 5},
+                showactive=True,
+                x=0.1,
+                xanchor="left",
+                y=-0.125,
+                yanchor="bottom"
+            ),
+            ## Button for reversing color scale
+            dict(
+                buttons=list([
+                    dict(
+                        args=[{"reversescale": [False, None]}],
+                        label="False",
+                        method="restyle"
+                    ),
+                    dict(
+                        args=[{"reversescale": [True, None]}],
+                        label="True",
+                        method="restyle"
+                    )
+                ]),
+                type = "buttons",
+                direction="right",
+                pad={"r": 5, "t": 5},
+                showactive=True,
+                x=0.4,
+                xanchor="left",
+                y=-0.125,
+                yanchor="bottom"
+            ),
+        ]
+    )
+    # Add annotations for buttons
+    fig.update_layout(
+        annotations=[
+            # dict(
+            #     text="Trace Type", x=0.05, xref="x domain", y=-0.2,
+            #     yref="y domain", align="left", showarrow=False
+            # ),
+            dict(
+                text='<em>Yield Curve', x=0.3, y=1,
+                xref="paper", yref="paper", showarrow=False
+            ),
+            dict(
+                text='Relevant Articles', x=0.9, y=1,
+                xref="paper", yref="paper", showarrow=False
+            ),
+            dict(
+                text="Color<br>Scale", x=0.05, xref="x domain",
+                y=-0.125, yref="y domain", showarrow=False
+            ),
+            dict(
+                text="Reverse<br>Colorscale", x=0.37, xref="x domain",
+                y=-0.125, yref="y domain", showarrow=False
+            ),
+        ]
+    )
+    
+    ## Add the articles table
+    fig.add_trace(article_table(art_lst, profiler), row = 2, col = 1)
+    
+    return fig
+
+## Define `Yield_Heatmap` which will create the lightweight Yield Curve figure
+def Yield_Heatmap(yield_df, art_lst, friday, profiler=None, method='nss', tenor_grid=None):
+    """
+    Create a lightweight 2D visual of US Yield Curve data.
+    
+    The figure is a heatmap of yields by date and tenor, a row of small-multiple charts
+    comparing the latest curve to the curve at several points in the past, and the
+    relevant articles table. It is much cheaper to render than the 3D surface in `Yield_Plot`,
+    especially on laptops and phones. Pair it with a `lod_dates` schedule in `yield_curve` so
+    only the latest weeks are drawn at full resolution.
+    
+    Parameters
+    ----------
+    yield_df : pd.DataFrame
+        The yield curve data with a `Date` column followed by one column per tenor.
+    art_lst : list
+        The list of article summaries for each asset being reported on.
+    friday : dt.date
+        The friday of the week being reported on.
+    profiler : ReportProfiler, optional
+        Records the payload of the articles table if provided. The default is None.
+    method : str, optional
+        The `yield_fit` method used to smooth the curves. The default is 'nss'.
+    tenor_grid : array-like, optional
+        The tenors, in years, to evaluate the fitted curves on. The default is None.
+        
+    Returns
+    -------
+    fig : go.Figure
+        The yield curve figure.
+        
+    """
+    # Define the snapshots compared in the small-multiple charts
+    snapshots = {'1wk Ago': 7, '1mo Ago': 28, '3mo Ago': 91, '6mo Ago': 182, '1y Ago': 364, '2y Ago': 728}
+    n_snaps   = len(snapshots)
+    
+    specs = [[{"type": "xy", 'colspan': n_snaps}] + [None] * (n_snaps - 1),
+             [{"type": "xy"}] * n_snaps,
+             [{"type": "table", 'colspan': n_snaps}] + [None] * (n_snaps - 1)]
+    subtitles = ['<em>US Yield Curve'] + list(snapshots.keys()) + ['Relevant Articles']
+    
+    # Create the figure object
+    fig = make_subplots(
+        rows = 3,
+        cols = n_snaps,
+        row_heights = [2, 1, 1],
+        horizontal_spacing = 0.02,
+        vertical_spacing = 0.07,
+        shared_yaxes = 'rows',
+        specs = specs,
+        subplot_titles = subtitles,
+    )
+    
+    fig.update_layout(
+        template = 'seaborn',
+        height = 1000,
+        autosize = True,
+        hovermode = 'closest',
+        showlegend = False,
+    )
+    
+    # Add the heatmap of yields by date and tenor
+    x_dat, y_dat, z_dat = surface_data(yield_df, method, tenor_grid)
+    fig.add_trace(
+        go.Heatmap(
+            x = x_dat,
+            y = y_dat,
+            z = z_dat,
+            colorscale = 'RdBu',
+            reversescale = True,
+            colorbar = dict(title = 'Yield', len = 0.45, y = 0.8),
+        ),
+        row = 1,
+        col = 1
+    )
+    fig.update_xaxes(title = "Tenor" if method is None else "Tenor (Years)", row = 1, col = 1)
+    fig.update_yaxes(title = "Closing Date", row = 1, col = 1)
+    
+    # Add the small-multiple charts of the latest curve against past curves
+    latest = len(y_dat) - 1
+    snap_rows = np.searchsorted(
+        np.asarray(y_dat, dtype='datetime64[ns]'),
+        np.array([np.datetime64(friday - dt.timedelta(days=days)) for days in snapshots.values()],
+                 dtype='datetime64[ns]'),
+        side = 'right'
+    ) - 1
+    for col, row in enumerate(snap_rows, start=1):
+        if row < 0:
+            continue
+        for i, color, dash in [(latest, 'firebrick', 'solid'), (row, 'midnightblue', 'dot')]:
+            fig.add_trace(
+                go.Scatter(
+                    x    = x_dat,
+                    y    = z_dat[i],
+                    mode = 'lines',
+                    name = str(pd.Timestamp(y_dat[i]).date()),
+                    line = dict(color = color, dash = dash, width = 2),
+                ),
+                row = 2,
+                col = col
+            )
+    
+    ## Add the articles table
+    fig.add_trace(article_table(art_lst, profiler), row = 3, col = 1)
+    
+    return fig
+
+## Define `surface_data` to collect the x, y, z data drawn in the yield curve figures
+def surface_data(yield_df, method='nss', tenor_grid=None):
+    """Collect the tenors, dates, and yields to draw, fitting the curves if `method` is set."""
+    if method is None:
+        x_dat = yield_df.columns[1:]
+        y_dat = yield_df.iloc[:, 0].to_numpy()
+        z_dat = yield_df.iloc[:, 1:].to_numpy()
+    else:
+        # Evaluate the fitted curves on an evenly spaced grid of tenors
+        tenor_grid = np.linspace(1 / 12, 10, 60) if tenor_grid is None else tenor_grid
+        fitted = curve_model(method).fit(yield_df).evaluate(tenor_grid, yield_df.Date)
+        x_dat = np.round(fitted.columns.to_numpy(dtype=float), 3)
+        y_dat = fitted.index.to_numpy()
+        z_dat = fitted.round(3).to_numpy()
+    
+    return x_dat, y_dat, z_dat
+
+## Define `article_table` to create the relevant articles table for the yield curve figures
+def article_table(art_lst, profiler=None):
+    """Create the `go.Table` of relevant articles for the yield curve."""
+    # Collect the articles table
+    articles = profiled(profiler, 'YIELD', 'plotly_article_table', plotly_article_table, 'YIELD', art_lst)
+    
+    # Create a list of fill colors for the table cells
+    cell_fill_color = ['whitesmoke'] * 3
+    head_fill_color = ['palegoldenrod'] * 3
+
+    # Create the table object to be added to the figure
+    table = go.Table(
+        header = dict(
+            values     = list(articles.columns),
+            font       = dict(size=14, color='black'),
+            line_color = None,
+            fill_color = head_fill_color,
+            align      = 'left'
+        ),
+        cells  = dict(
+            values     = [articles[col] for col in articles.columns],
+            font       = dict(size=12, color='black'),
+            line_color = None,
+            fill_color = cell_fill_color,
+            align      = 'left',
+            height     = 25
+        ),
+        columnwidth = [1, 1, 1.6],
+    )
+    
+    return table
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+Test collecting pages over HTTP against a local fixture server.
+
+@author: grega
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '_GH_lib'))
+
+pytest.importorskip('aiohttp')
+
+from http_fetch import fetch_pages, fixture_server, needs_browser
+from rate_limit import DomainScheduler
+
+PAGE = '<html><head><title>Stocks &amp; Bonds Rally</title></head><body><p>Text.</p></body></html>'
+
+@pytest.fixture
+def publisher(tmp_path):
+    """Serve a saved article, with a link that redirects to it."""
+    (tmp_path / 'story.html').write_text(PAGE)
+    with fixture_server(str(tmp_path), redirects={'/articles/1': '/story.html'}) as base:
+        yield base
+
+def fetch(urls):
+    """Fetch pages with a scheduler that never delays the requests."""
+    return fetch_pages(urls, scheduler=DomainScheduler(rate=1000, burst=1000))
+
+def test_fetch_follows_redirects(publisher):
+    page, = fetch([publisher + '/articles/1'])
+    
+    assert page['url'] == publisher + '/story.html'
+    assert page['title'] == 'Stocks & Bonds Rally'
+    assert '<p>Text.</p>' in page['page']
+
+def test_fetch_keeps_order_and_drops_missing_pages(publisher):
+    pages = fetch([publisher + '/missing.html', publisher + '/story.html'])
+    
+    assert pages[0] is None
+    assert pages[1]['url'] == publisher + '/story.html'
+
+def test_browser_publishers_fall_back_to_selenium():
+    assert needs_browser('https://news.google.com/articles/CBMi')
+    assert needs_browser('https://www.wsj.com/articles/markets')
+    assert not needs_browser('https://www.reuters.com/markets/')